@@ -0,0 +1,57 @@
+"""add indexes on the lookup and foreign key columns
+
+Revision ID: a1f3c5e7b9d2
+Revises: 00d5e4e8fba1
+Create Date: 2026-10-18 10:12:31.447212
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "a1f3c5e7b9d2"
+down_revision = "00d5e4e8fba1"
+branch_labels = None
+depends_on = None
+
+from alembic import op
+import sqlalchemy as sa
+
+
+INDEXES = [
+    ("ix_elements_symbol", "elements", ["symbol"]),
+    ("ix_elements_name", "elements", ["name"]),
+    (
+        "ix_isotopes_atomic_number_mass_number",
+        "isotopes",
+        ["atomic_number", "mass_number"],
+    ),
+    ("ix_isotopedecaymodes_isotope_id", "isotopedecaymodes", ["isotope_id"]),
+    (
+        "ix_ionizationenergies_atomic_number_ion_charge",
+        "ionizationenergies",
+        ["atomic_number", "ion_charge"],
+    ),
+    ("ix_ionicradii_atomic_number_charge", "ionicradii", ["atomic_number", "charge"]),
+    ("ix_oxidationstates_atomic_number", "oxidationstates", ["atomic_number"]),
+    ("ix_phasetransitions_atomic_number", "phasetransitions", ["atomic_number"]),
+    (
+        "ix_scattering_factors_atomic_number_energy",
+        "scattering_factors",
+        ["atomic_number", "energy"],
+    ),
+    ("ix_screeningconstants_atomic_number", "screeningconstants", ["atomic_number"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+    # collect statistics for the query planner
+    op.execute("ANALYZE")
+
+
+def downgrade():
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+
+    op.execute("DROP TABLE IF EXISTS sqlite_stat1")
@@ -4,12 +4,21 @@ __version__ = "1.1.0"
 
 import importlib
 
-from .mendeleev import (  # noqa: F401
-    element,
-    isotope,
-    get_all_elements,
-    get_attribute_for_all_elements,
-)
+# public functions imported from submodules on first access, see `__getattr__`
+_lazy_attributes = {
+    "element": "mendeleev",
+    "isotope": "mendeleev",
+    "get_all_elements": "mendeleev",
+    "get_attribute_for_all_elements": "mendeleev",
+    "get_attributes_for_all_elements": "mendeleev",
+    "gather": "mendeleev",
+    "gather_many": "mendeleev",
+    "resolve": "mendeleev",
+    "resolve_many": "mendeleev",
+}
+
+# names exported by `from mendeleev import *`, resolved through `__getattr__`
+__all__ = list(_lazy_attributes)
 
 
 _symbols = [
@@ -136,16 +145,27 @@ _symbols = [
 
 def __getattr__(name):
     """
-    Dynamically creates an element object and stores it in the module's namespace.
+    Lazily resolve the public functions, element objects and submodules.
+
+    The functions and submodules are stored in the module's namespace, while
+    the element symbols are looked up with :py:func:`mendeleev.element` on
+    every access, so that each thread gets the instance bound to its own
+    session and the instances are refreshed after :py:func:`mendeleev.db.reset`.
+
+    The heavy dependencies (SQLAlchemy, numpy, pandas, pint) are only imported
+    once one of the attributes that needs them is accessed.
 
     Args:
-        name (str): The symbol of the element to be created.
+        name (str): Name of a public function, symbol of an element or
+            name of a submodule.
 
     Returns:
-        Element: The element object corresponding to the provided symbol.
+        The function, the element object corresponding to the provided
+        symbol or the submodule.
 
     Raises:
-        ImportError: If the element symbol is not found in _symbols.
+        AttributeError: If the name is neither a public function, an element
+            symbol nor a submodule.
 
     Examples:
         Usage:
@@ -153,15 +173,25 @@ def __getattr__(name):
         >>> print(C.atomic_number)
         6
     """
+    if name in _lazy_attributes:
+        module = importlib.import_module(f".{_lazy_attributes[name]}", __name__)
+        attribute = getattr(module, name)
+        globals()[name] = attribute
+        return attribute
+
     if name in _symbols:
-        element_obj = element(name)  # noqa: F405
-        globals()[name] = element_obj
-        return element_obj
+        return __getattr__("element")(name)
 
-    # attempt to import the module if it's not an element symbol
+    # attempt to import the submodule if it's not an element symbol
     try:
-        module = importlib.import_module(name)
-        globals()[name] = module
-        return module
+        module = importlib.import_module(f".{name}", __name__)
     except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
         raise AttributeError(f"module 'mendeleev' has no attribute '{name}'") from e
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attributes) + _symbols)
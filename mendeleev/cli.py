@@ -26,7 +26,7 @@ def clielement() -> None:
 
     with contextlib.suppress(ValueError):
         args.element = int(args.element)
-    e = element(args.element)
+    e = element(args.element, load=["text"])
 
     f = Figlet("dotmatrix", justify="center")
     symbol = f.renderText(e.symbol)
@@ -1,35 +1,246 @@
 """Low-level database access functions."""
 
+import hashlib
 import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Tuple
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
 from sqlalchemy.engine.base import Engine
 
 
 DBNAME = "elements.db"
 
+# Environment variable enabling the in-memory mode, see `use_in_memory`
+IN_MEMORY_ENV = "MENDELEEV_IN_MEMORY"
+
+# Options passed to ``create_engine`` for every engine in the registry. Each
+# thread keeps one connection checked out through its shared session, so the
+# overflow is unbounded by default to avoid pool timeouts in threaded code.
+DEFAULT_POOL_OPTIONS: Dict[str, Any] = {"pool_size": 5, "max_overflow": -1}
+
+_pool_options: Dict[str, Any] = dict(DEFAULT_POOL_OPTIONS)
+_engines: Dict[Tuple[str, bool], Engine] = {}
+_session_factories: Dict[Tuple[str, bool], sessionmaker] = {}
+_shared_sessions: Dict[Tuple[str, bool], scoped_session] = {}
+_lock = threading.RLock()
+# incremented on every reset to invalidate data cached from the database
+_generation = 0
+_in_memory = os.environ.get(IN_MEMORY_ENV, "").lower() in {"1", "true", "yes", "on"}
+# connections keeping the shared in-memory databases alive, keyed by URI
+_memory_databases: Dict[str, sqlite3.Connection] = {}
+
 
 def get_package_dbpath() -> str:
     """Return the default database path"""
     return os.path.join(os.path.abspath(os.path.dirname(__file__)), DBNAME)
 
 
-def get_engine(dbpath: str = None, read_only: bool = True) -> Engine:
-    """Return the db engine"""
+def _registry_key(dbpath: str = None, read_only: bool = True) -> Tuple[str, bool]:
+    "Normalize the arguments identifying an engine in the registry"
     if not dbpath:
         dbpath = get_package_dbpath()
+    return os.path.abspath(dbpath), bool(read_only)
+
+
+def _load_into_memory(dbpath: str) -> str:
+    """Copy the database file into a shared in-memory database.
+
+    The copy is made once with the SQLite backup API and kept alive until
+    :py:func:`reset` is called. Returns the URI of the in-memory database.
+    """
+    name = hashlib.sha1(dbpath.encode("utf-8")).hexdigest()[:16]
+    uri = f"file:mendeleev-{name}?mode=memory&cache=shared"
+    if uri not in _memory_databases:
+        target = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        source = sqlite3.connect(f"file:{dbpath}?mode=ro", uri=True)
+        try:
+            source.backup(target)
+        finally:
+            source.close()
+        _memory_databases[uri] = target
+    return uri
+
+
+def _create_engine(dbpath: str, read_only: bool) -> Engine:
+    "Create a new engine with the configured connection pool options"
+    if read_only and _in_memory:
+        uri = _load_into_memory(dbpath)
+
+        def connect() -> sqlite3.Connection:
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA query_only = ON")
+            return conn
+
+        options = {"poolclass": QueuePool, **_pool_options}
+        return create_engine("sqlite://", creator=connect, echo=False, **options)
     if read_only:
         connectstr = "sqlite:///file:{path:s}?mode=ro&nolock=1&uri=true".format(
             path=dbpath
         )
     else:
         connectstr = "sqlite:///{path:s}".format(path=dbpath)
-    return create_engine(connectstr, echo=False)
+    # SQLAlchemy 1.4 defaults to NullPool for SQLite files, which rejects the
+    # pool sizing options, the pooled connections are used by one thread at a time
+    options = {
+        "poolclass": QueuePool,
+        "connect_args": {"check_same_thread": False},
+        **_pool_options,
+    }
+    return create_engine(connectstr, echo=False, **options)
+
+
+def get_engine(dbpath: str = None, read_only: bool = True) -> Engine:
+    """Return the db engine
+
+    Engines are created once per ``(dbpath, read_only)`` pair and reused for
+    the lifetime of the process, see :py:func:`reset` to dispose of them.
+    """
+    key = _registry_key(dbpath=dbpath, read_only=read_only)
+    engine = _engines.get(key)
+    if engine is None:
+        with _lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = _create_engine(*key)
+                _engines[key] = engine
+    return engine
+
+
+def _get_session_factory(dbpath: str = None, read_only: bool = True) -> sessionmaker:
+    "Return the session factory bound to the registered engine"
+    key = _registry_key(dbpath=dbpath, read_only=read_only)
+    factory = _session_factories.get(key)
+    if factory is None:
+        with _lock:
+            factory = _session_factories.get(key)
+            if factory is None:
+                factory = sessionmaker(
+                    bind=get_engine(*key),
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+                _session_factories[key] = factory
+    return factory
 
 
 def get_session(dbpath: str = None, read_only: bool = True) -> Session:
-    """Return the database session connection."""
-    engine = get_engine(dbpath=dbpath, read_only=read_only)
-    db_session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    return db_session()
+    """Return the database session connection.
+
+    The session is owned by the caller and should be closed when no longer needed.
+    """
+    return _get_session_factory(dbpath=dbpath, read_only=read_only)()
+
+
+def get_shared_session(dbpath: str = None, read_only: bool = True) -> Session:
+    """Return the process-wide session for the current thread.
+
+    The session is reused by all the lookups made from the same thread and
+    should not be closed by the caller, use :py:func:`reset` instead.
+    """
+    key = _registry_key(dbpath=dbpath, read_only=read_only)
+    registry = _shared_sessions.get(key)
+    if registry is None:
+        with _lock:
+            registry = _shared_sessions.get(key)
+            if registry is None:
+                registry = scoped_session(_get_session_factory(*key))
+                _shared_sessions[key] = registry
+    return registry()
+
+
+def database_path(bind: Engine) -> str:
+    """Return the path of the database file used by the engine or connection.
+
+    Engines from the registry, including the ones serving an in-memory copy,
+    are identified by the path of the database file they were created for.
+    """
+    engine = getattr(bind, "engine", bind)
+    for (dbpath, _), registered in list(_engines.items()):
+        if registered is engine:
+            return dbpath
+    return engine.url.database
+
+
+def cache_token() -> Tuple[str, bool, int]:
+    """Return a token identifying the current state of the default database.
+
+    The token changes whenever the database path or mode changes or
+    :py:func:`reset` is called, caches built from the database should be
+    discarded when it does.
+    """
+    return _registry_key()[0], _in_memory, _generation
+
+
+def configure_pool(**options: Any) -> None:
+    """Set the connection pool options used for new engines.
+
+    Args:
+        options: keyword arguments passed to :py:func:`sqlalchemy.create_engine`,
+            e.g. ``pool_size``, ``max_overflow``, ``pool_timeout`` or ``poolclass``.
+            Calling without arguments restores the defaults.
+
+    Existing engines are disposed of and recreated on next use.
+    """
+    with _lock:
+        _pool_options.clear()
+        _pool_options.update(options if options else DEFAULT_POOL_OPTIONS)
+        reset()
+
+
+def use_in_memory(enabled: bool = True) -> None:
+    """Serve read-only database access from an in-memory copy of the database.
+
+    Args:
+        enabled: if `True` the database file is copied into RAM once on first
+            use and all the subsequent read-only engines and sessions use the
+            copy, if `False` the database file is used directly
+
+    The mode can also be enabled by setting the ``MENDELEEV_IN_MEMORY``
+    environment variable to ``1`` before importing mendeleev.
+    """
+    global _in_memory
+    with _lock:
+        _in_memory = bool(enabled)
+        reset()
+
+
+def reset() -> None:
+    """Close the shared sessions and dispose of all the registered engines.
+
+    The instances loaded by the calling thread are moved to its new shared
+    sessions, so they can still load their deferred columns and relationships
+    on access. Instances loaded by other threads are not moved, since their
+    sessions can only be used by the thread that owns them.
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        loaded = {}
+        for key, registry in _shared_sessions.items():
+            if registry.registry.has():
+                loaded[key] = list(registry().identity_map.values())
+            registry.remove()
+        for engine in _engines.values():
+            engine.dispose()
+        _shared_sessions.clear()
+        _session_factories.clear()
+        _engines.clear()
+        for conn in _memory_databases.values():
+            conn.close()
+        _memory_databases.clear()
+        for key, instances in loaded.items():
+            if instances:
+                _reattach(get_shared_session(*key), instances)
+
+
+def _reattach(session: Session, instances: List[Any]) -> None:
+    "Add the detached `instances` to the `session`"
+    for instance in instances:
+        # adding an instance cascades to its loaded relationships, skip the
+        # instances that were already attached that way
+        if inspect(instance).detached:
+            session.add(instance)
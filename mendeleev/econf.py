@@ -4,9 +4,13 @@ Implementation of the abstraction for the elctronic configuration object.
 
 from typing import Dict, List, Pattern, Tuple, Union
 from collections import OrderedDict
+from functools import lru_cache
+import copy
 import math
 import re
 
+import numpy as np
+
 
 ORBITALS = ("s", "p", "d", "f", "g", "h", "i", "j", "k")
 SHELLS = ("K", "L", "M", "N", "O", "P", "Q")
@@ -65,19 +69,70 @@ def shell_capactity(shell: str) -> int:
         )
 
 
+# shape of the occupation arrays indexed by ``[n, l]``, the row ``n = 0`` is unused
+OCCUPATIONS_SHAPE = (10, len(ORBITALS))
+
+# default patterns for the noble gas core symbols and the subshells
+ATOM_RE = re.compile(r"\[([A-Z][a-z]*)\]")
+SHELL_RE = re.compile(r"(?P<n>\d)(?P<o>[spdfghijk])(?P<e>\d+)?")
+
+NOBLE_GASES = OrderedDict(
+    [
+        ("He", "1s2"),
+        ("Ne", "1s2 2s2 2p6"),
+        ("Ar", "1s2 2s2 2p6 3s2 3p6"),
+        ("Kr", "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6"),
+        ("Xe", "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6 5s2 4d10 5p6"),
+        ("Rn", "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6 5s2 4d10 5p6 6s2 4f14 5d10 6p6"),
+    ]
+)
+
+
+def _parse_subshells(items: List[str], shellre: Pattern) -> Tuple:
+    "Return the ``((n, o), e)`` pairs of the subshell labels matching `shellre`"
+    subshells = []
+    for item in items:
+        match = shellre.match(item)
+        if match:
+            n, o, e = match.group("n", "o", "e")
+            subshells.append(((int(n), o), (int(e) if e is not None else 1)))
+    return tuple(subshells)
+
+
+# occupations of the noble gas cores parsed with the default pattern
+NOBLE_GAS_CORES = OrderedDict(
+    (symbol, _parse_subshells(conf.split(), SHELL_RE))
+    for symbol, conf in NOBLE_GASES.items()
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse(
+    string: str, atomre: Pattern = ATOM_RE, shellre: Pattern = SHELL_RE
+) -> Tuple:
+    """
+    Parse a configuration ``string`` into a tuple of ``((n, o), e)`` pairs,
+    the results are cached since the same configurations are parsed repeatedly
+    """
+    citems = string.split()
+    core = ()
+
+    match = atomre.match(citems[0])
+    if match:
+        symbol = str(match.group(1))
+        citems = citems[1:]
+        if shellre is SHELL_RE:
+            core = NOBLE_GAS_CORES[symbol]
+        else:
+            core = _parse_subshells(NOBLE_GASES[symbol].split(), shellre)
+
+    return core + _parse_subshells(citems, shellre)
+
+
 class ElectronicConfiguration(object):
     """Electronic configuration handler"""
 
-    noble = OrderedDict(
-        [
-            ("He", "1s2"),
-            ("Ne", "1s2 2s2 2p6"),
-            ("Ar", "1s2 2s2 2p6 3s2 3p6"),
-            ("Kr", "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6"),
-            ("Xe", "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6 5s2 4d10 5p6"),
-            ("Rn", "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6 5s2 4d10 5p6 6s2 4f14 5d10 6p6"),
-        ]
-    )
+    noble = NOBLE_GASES
 
     def __init__(
         self, conf: Union[str, Dict] = None, atomre: str = None, shellre: str = None
@@ -112,7 +167,7 @@ class ElectronicConfiguration(object):
     @atomre.setter
     def atomre(self, value: str) -> None:
         if value is None:
-            self._atomre = re.compile(r"\[([A-Z][a-z]*)\]")
+            self._atomre = ATOM_RE
         else:
             self._atomre = re.compile(value)
 
@@ -124,7 +179,7 @@ class ElectronicConfiguration(object):
     @shellre.setter
     def shellre(self, value: str) -> None:
         if value is None:
-            self._shellre = re.compile(r"(?P<n>\d)(?P<o>[spdfghijk])(?P<e>\d+)?")
+            self._shellre = SHELL_RE
         else:
             self._shellre = re.compile(value)
 
@@ -134,31 +189,7 @@ class ElectronicConfiguration(object):
         ``OrderedDict`` representation
         """
 
-        core = {}
-        citems = string.split()
-
-        if self.atomre.match(citems[0]):
-            symbol = str(self.atomre.match(citems[0]).group(1))
-            citems = citems[1:]
-            core = [
-                self.shellre.match(o).group("n", "o", "e")
-                for o in ElectronicConfiguration.noble[symbol].split()
-                if self.shellre.match(o)
-            ]
-            core = OrderedDict(
-                [((int(n), o), (int(e) if e is not None else 1)) for (n, o, e) in core]
-            )
-
-        valence = [
-            self.shellre.match(o).group("n", "o", "e")
-            for o in citems
-            if self.shellre.match(o)
-        ]
-        valence = OrderedDict(
-            [((int(n), o), (int(e) if e is not None else 1)) for (n, o, e) in valence]
-        )
-
-        self._conf = OrderedDict(list(core.items()) + list(valence.items()))
+        self._conf = OrderedDict(_parse(string, self.atomre, self.shellre))
 
     def get_largest_core(self) -> Tuple:
         """
@@ -167,12 +198,9 @@ class ElectronicConfiguration(object):
         gas element.
         """
         confset = set(self.conf.items())
-        for s, conf in reversed(ElectronicConfiguration.noble.items()):
-            ec = ElectronicConfiguration(conf)
-            nobleset = set(ec.conf.items())
-            ans = confset.issuperset(nobleset)
-            if ans:
-                return (s, ec)
+        for s, core in reversed(NOBLE_GAS_CORES.items()):
+            if confset.issuperset(core):
+                return (s, ElectronicConfiguration(NOBLE_GASES[s]))
 
     def get_valence(self):
         """
@@ -259,6 +287,19 @@ class ElectronicConfiguration(object):
         else:
             raise ValueError(f"Cannot process block: {block}")
 
+    def occupations(self) -> np.ndarray:
+        """
+        Return the occupations as an integer array of shape
+        ``OCCUPATIONS_SHAPE`` indexed by the principal and azimuthal quantum
+        numbers ``[n, l]``
+        """
+        occ = np.zeros(OCCUPATIONS_SHAPE, dtype=int)
+        for (n, o), e in self.conf.items():
+            if not 0 < n < OCCUPATIONS_SHAPE[0]:
+                raise ValueError(f"principal quantum number out of range: {n}")
+            occ[n, get_l(o)] = e
+        return occ
+
     def ne(self) -> int:
         "Number of electrons"
         return sum(list(self.conf.values()))
@@ -273,7 +314,8 @@ class ElectronicConfiguration(object):
         Remove `n` electrons from and return a new `ElectronicConfiguration`
         object"""
 
-        newec = ElectronicConfiguration(str(self.__str__()))
+        newec = copy.copy(self)
+        newec._conf = OrderedDict(self.conf)
 
         for _ in range(n):
             if not newec.conf:
@@ -378,6 +420,67 @@ class ElectronicConfiguration(object):
         return self.to_str()
 
 
+def valence_subshells(occupations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the valence subshells, the subshells with the largest `l` among the
+    ones with the largest `n`, as used by default in
+    :py:meth:`Element.zeff <mendeleev.models.Element.zeff>`
+
+    Args:
+        occupations: occupation arrays indexed by ``[..., n, l]``, see
+            :py:meth:`ElectronicConfiguration.occupations`
+
+    Returns:
+        arrays of the `n` and `l` quantum numbers of the valence subshells
+    """
+    occupied = np.asarray(occupations) > 0
+    nmax, lmax = occupied.shape[-2:]
+    shells = occupied.any(axis=-1)
+    ns = nmax - 1 - np.argmax(shells[..., ::-1], axis=-1)
+    valence = np.take_along_axis(occupied, ns[..., np.newaxis, np.newaxis], axis=-2)
+    ls = lmax - 1 - np.argmax(valence[..., 0, ::-1], axis=-1)
+    return ns, ls
+
+
+def slater_screening_array(occupations: np.ndarray, alle: bool = False) -> np.ndarray:
+    """
+    Calculate Slater's screening constants for all the `s`, `p`, `d` and `f`
+    subshells of one or more configurations at once, following
+    :py:meth:`ElectronicConfiguration.slater_screening`
+
+    Args:
+        occupations: occupation arrays indexed by ``[..., n, l]``, see
+            :py:meth:`ElectronicConfiguration.occupations`
+        alle: Use all the valence electrons, i.e. calculate screening for
+            an extra electron
+
+    Returns:
+        screening constants indexed by ``[..., n, l]`` for ``l`` up to 3
+    """
+    occ = np.asarray(occupations, dtype=float)
+    ne = 0.0 if alle else 1.0
+    coeff = np.full(occ.shape[-2], 0.35)
+    coeff[1] = 0.3
+
+    # electrons in the shell n, in the shell n - 1 and in all the shells below n
+    shell = occ.sum(axis=-1)
+    previous = np.zeros_like(shell)
+    previous[..., 1:] = shell[..., :-1]
+    below = np.cumsum(shell, axis=-1) - shell
+
+    sp = 0.85 * previous + (below - previous) + coeff * (occ[..., 0] + occ[..., 1] - ne)
+    df = occ[..., 2:4]
+    screening_df = (
+        shell[..., np.newaxis]
+        - df
+        + below[..., np.newaxis]
+        + coeff[:, np.newaxis] * (df - ne)
+    )
+    return np.concatenate(
+        [sp[..., np.newaxis], sp[..., np.newaxis], screening_df], axis=-1
+    )
+
+
 def get_spin_strings(sodict, average: bool = True):
     """
     spin strings as numpy arrays
@@ -2,22 +2,26 @@
 Electronegativity scale formulas.
 """
 
-import math
-from typing import List, Union
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 import numpy as np
+from numpy.typing import ArrayLike
 
 
 # Rydberg constant
 RY = 13.605693009
 
 
-def n_effective(n: int, source: str = "slater") -> Union[float, None]:
+def n_effective(
+    n: Union[int, np.ndarray], source: str = "slater"
+) -> Union[float, None, np.ndarray]:
     """
     Effective principal quantum number
 
     Args:
-        n: Principal quantum number
+        n: Principal quantum number or an array of them, for arrays the
+            values for unknown numbers are NaN
         source: either `slater` or `zhang`, for more information see note below.
 
     .. note::
@@ -35,44 +39,80 @@ def n_effective(n: int, source: str = "slater") -> Union[float, None]:
         "zhang": {1: 0.85, 2: 1.99, 3: 2.89, 4: 3.45, 5: 3.85, 6: 4.36, 7: 4.99},
     }
 
-    if source in numbers:
-        return numbers.get(source).get(n)
-    else:
+    if source not in numbers:
         raise ValueError(
             f"source '{source}' not found, available sources are: {', '.join(numbers.keys())}"
         )
 
+    if np.ndim(n) == 0:
+        return numbers.get(source).get(n)
+
+    table = numbers.get(source)
+    lookup = np.full(max(table) + 1, np.nan)
+    lookup[list(table)] = list(table.values())
+    n = np.asarray(n, dtype=int)
+    known = (n >= 0) & (n < lookup.size)
+    values = np.full(n.shape, np.nan)
+    values[known] = lookup[n[known]]
+    return values
+
+
+@lru_cache(maxsize=128)
+def _extrapolation_fit(
+    x_ref: Tuple[float, ...], y_ref: Tuple[float, ...], poly_deg: int, above: bool
+) -> np.poly1d:
+    """
+    Fit the polynomial used to extrapolate beyond the reference points, from
+    the three last points if `above` is `True` and from the three first
+    otherwise.
+    """
+    points = slice(-3, None) if above else slice(None, 3)
+    return np.poly1d(np.polyfit(x_ref[points], y_ref[points], poly_deg))
+
 
 def interpolate_property(
-    x: int, x_ref: List[int], y_ref: List[float], poly_deg: int = 1
-) -> float:
+    x: Union[float, ArrayLike],
+    x_ref: List[int],
+    y_ref: List[float],
+    poly_deg: int = 1,
+) -> Union[float, np.ndarray]:
     """
     Estiate a property for element by interpolation or
     extrapolation of the data points from x`x_ref` and `y_ref`.
 
     Args:
-        x: value for which the property will be evaluated
+        x: value or array of values for which the property will be evaluated
         x_ref: list of values for the elements
         y_ref: list of values of the property for the elements
         deg: degree of the polynomial used in the extrapolation beyond
             the provided data points, default=1
+
+    The extrapolation polynomials are cached for each set of reference data.
     """
-    x_ref = np.array(x_ref)
-    y_ref = np.array(y_ref)
-    if x_ref.min() <= x <= x_ref.max():
-        return np.interp([x], x_ref, y_ref)
+    x_ref = np.asarray(x_ref, dtype=float)
+    y_ref = np.asarray(y_ref, dtype=float)
+    if x_ref.shape != y_ref.shape:
+        raise ValueError(
+            f"x_ref and y_ref should have the same shape, got: {x_ref.shape} and {y_ref.shape}"
+        )
+
+    values = np.asarray(x, dtype=float)
+    result = np.interp(values, x_ref, y_ref)
 
     # extrapolation
-    if x < x_ref.min():
-        x_slice = x_ref[:3]
-        y_slice = y_ref[:3]
-    elif x > x_ref.max():
-        x_slice = x_ref[-3:]
-        y_slice = y_ref[-3:]
+    for above, outside in (
+        (False, values < x_ref.min()),
+        (True, values > x_ref.max()),
+    ):
+        if np.any(outside):
+            fn = _extrapolation_fit(
+                tuple(x_ref.tolist()), tuple(y_ref.tolist()), poly_deg, above
+            )
+            result = np.where(outside, fn(values), result)
 
-    fit = np.polyfit(x_slice, y_slice, poly_deg)
-    fn = np.poly1d(fit)
-    return fn(x)
+    if result.ndim == 0:
+        return float(result)
+    return result
 
 
 def allred_rochow(zeff: float, radius: float) -> float:
@@ -120,14 +160,16 @@ def li_xue(ionization_energy: float, radius: float, valence_pqn: int) -> float:
     of Li and Xue
 
     Args:
-        charge: Charge of the ion
-        radius: Type of radius to be used in the calculation, either `crystal_radius` as recommended in the paper or `ionic_radius`
+        ionization_energy: Ionization energy of the ion
+        radius: Radius of the ion, either `crystal_radius` as recommended in the paper or `ionic_radius`
         valence_pqn: valence principal quantum number
+
+    All the arguments can also be arrays of the same shape.
     """
 
     return (
         n_effective(valence_pqn, source="zhang")
-        * math.sqrt(ionization_energy / RY)
+        * np.sqrt(np.divide(ionization_energy, RY))
         * 100.0
         / radius
     )
@@ -216,7 +258,7 @@ def sanderson(radius: float, noble_gas_radius: float) -> float:
 
     """
 
-    return math.pow(noble_gas_radius / radius, 3)
+    return np.power(noble_gas_radius / radius, 3)
 
 
 def generic(zeff: float, radius: float, rpow: float = 1, apow: float = 1) -> float:
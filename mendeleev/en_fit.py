@@ -0,0 +1,215 @@
+r"""
+Fitting custom electronegativity scales of the generic form
+
+.. math::
+
+    \chi = \left(\frac{Z_{\text{eff}}}{r^{\beta}}\right)^{\alpha}
+
+see :py:func:`mendeleev.electronegativity.generic`, to a reference scale for
+all the elements at once.
+
+The functions operate on arrays of effective nuclear charges and radii of all
+the elements and broadcast over arrays of parameters, so that a sweep over a
+grid of :math:`\alpha, \beta` values is a few array operations.
+
+Examples:
+
+>>> from mendeleev.en_fit import fit_power_law, grid_search, scale_data
+>>> data = scale_data(radius="covalent_radius_pyykko", reference="en_pauling")
+>>> fit = fit_power_law(data.zeff, data.radius, data.reference)
+>>> sweep = grid_search(data, rpow=[0.5, 1.0, 2.0], apow=[0.5, 1.0])
+>>> sweep.shape
+(6, 6)
+"""
+
+from __future__ import annotations
+from collections import namedtuple
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .econf import valence_subshells
+from .mendeleev import get_attributes_for_all_elements
+from .models import occupation_table, slater_zeff_table
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+__all__ = [
+    "LinearFit",
+    "PowerLawFit",
+    "ScaleData",
+    "evaluate",
+    "fit_linear",
+    "fit_power_law",
+    "grid_search",
+    "scale_data",
+]
+
+
+ScaleData = namedtuple("ScaleData", ["atomic_number", "zeff", "radius", "reference"])
+LinearFit = namedtuple("LinearFit", ["slope", "intercept", "rmse", "r2"])
+PowerLawFit = namedtuple("PowerLawFit", ["rpow", "apow", "prefactor", "rmse"])
+
+
+def scale_data(
+    radius: str = "covalent_radius_pyykko", reference: str = "en_pauling"
+) -> ScaleData:
+    """
+    Collect the data needed to fit a scale for all the elements.
+
+    Args:
+        radius: name of the radius attribute of `Element`, e.g.
+            `covalent_radius_pyykko` or `atomic_radius_rahm`
+        reference: name of the attribute of `Element` with the reference
+            scale, e.g. `en_pauling`
+
+    Returns:
+        data (ScaleData): arrays of atomic numbers, Slater's effective nuclear
+            charges, radii and reference values ordered by atomic number,
+            missing values are NaN
+    """
+    data = get_attributes_for_all_elements(["atomic_number", radius, reference])
+    index = data["atomic_number"] - 1
+    max_n, max_l = valence_subshells(occupation_table()[index])
+    return ScaleData(
+        data["atomic_number"],
+        slater_zeff_table()[index, max_n, max_l],
+        np.asarray(data[radius], dtype=float),
+        np.asarray(data[reference], dtype=float),
+    )
+
+
+def evaluate(
+    zeff: ArrayLike,
+    radius: ArrayLike,
+    rpow: Union[float, ArrayLike] = 1,
+    apow: Union[float, ArrayLike] = 1,
+) -> np.ndarray:
+    """
+    Evaluate the generic electronegativity for all the elements and parameters.
+
+    Args:
+        zeff: effective nuclear charges of the elements
+        radius: radii of the elements
+        rpow: power or array of powers to raise the radius to
+        apow: power or array of powers to raise the fraction to
+
+    Returns:
+        values with the shape of the broadcast parameters followed by the shape
+        of `zeff` and `radius`
+    """
+    rpow = np.asarray(rpow, dtype=float)[..., np.newaxis]
+    apow = np.asarray(apow, dtype=float)[..., np.newaxis]
+    return np.exp(apow * (np.log(zeff) - rpow * np.log(radius)))
+
+
+def fit_linear(values: ArrayLike, reference: ArrayLike) -> LinearFit:
+    """
+    Fit the linear rescaling ``slope * values + intercept`` of the values to the
+    reference scale with least squares.
+
+    Args:
+        values: values of a scale for the elements, or an array of them stacked
+            along the leading axes, the elements are on the last axis
+        reference: values of the reference scale for the elements
+
+    Returns:
+        fit (LinearFit): slope, intercept, root mean square error and the
+            coefficient of determination for each set of values
+
+    Elements with missing values in either of the scales are ignored.
+    """
+    values = np.asarray(values, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    mask = np.isfinite(values) & np.isfinite(reference)
+    x = np.where(mask, values, 0.0)
+    y = np.where(mask, reference, 0.0)
+
+    n = mask.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        xmean = x.sum(axis=-1) / n
+        ymean = y.sum(axis=-1) / n
+        dx = np.where(mask, x - xmean[..., np.newaxis], 0.0)
+        dy = np.where(mask, y - ymean[..., np.newaxis], 0.0)
+        slope = (dx * dy).sum(axis=-1) / (dx * dx).sum(axis=-1)
+        intercept = ymean - slope * xmean
+        residuals = dy - slope[..., np.newaxis] * dx
+        ssr = (residuals * residuals).sum(axis=-1)
+        rmse = np.sqrt(ssr / n)
+        r2 = 1.0 - ssr / (dy * dy).sum(axis=-1)
+    return LinearFit(slope, intercept, rmse, r2)
+
+
+def fit_power_law(
+    zeff: ArrayLike, radius: ArrayLike, reference: ArrayLike
+) -> PowerLawFit:
+    r"""
+    Fit the parameters of the generic scale multiplied by a prefactor to the
+    reference scale with linear least squares in log space
+
+    .. math::
+
+        \ln\chi = \ln c + \alpha\ln Z_{\text{eff}} - \alpha\beta\ln r
+
+    Args:
+        zeff: effective nuclear charges of the elements
+        radius: radii of the elements
+        reference: values of the reference scale for the elements
+
+    Returns:
+        fit (PowerLawFit): `rpow` (:math:`\beta`), `apow` (:math:`\alpha`),
+            the `prefactor` (:math:`c`) and the root mean square error of the
+            fitted scale
+
+    Elements with missing or non-positive values are ignored.
+    """
+    zeff = np.asarray(zeff, dtype=float)
+    radius = np.asarray(radius, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    with np.errstate(invalid="ignore"):
+        mask = (zeff > 0) & (radius > 0) & (reference > 0)
+
+    design = np.column_stack(
+        [np.ones(mask.sum()), np.log(zeff[mask]), np.log(radius[mask])]
+    )
+    (logc, apow, coef), *_ = np.linalg.lstsq(
+        design, np.log(reference[mask]), rcond=None
+    )
+    rpow = -coef / apow
+    prefactor = np.exp(logc)
+    residuals = prefactor * evaluate(zeff[mask], radius[mask], rpow, apow)
+    rmse = np.sqrt(np.mean((residuals - reference[mask]) ** 2))
+    return PowerLawFit(float(rpow), float(apow), float(prefactor), float(rmse))
+
+
+def grid_search(data: ScaleData, rpow: ArrayLike, apow: ArrayLike) -> pd.DataFrame:
+    """
+    Evaluate the generic scale with the linear rescaling fitted to the
+    reference for all the combinations of the parameters.
+
+    Args:
+        data: data of the elements, see :py:func:`scale_data`
+        rpow: values of the power to raise the radius to
+        apow: values of the power to raise the fraction to
+
+    Returns:
+        df (pandas.DataFrame): table with the parameters and the fitted
+            `slope`, `intercept`, `rmse` and `r2`, one row per combination
+    """
+    import pandas as pd
+
+    rpows, apows = np.meshgrid(
+        np.asarray(rpow, dtype=float), np.asarray(apow, dtype=float), indexing="ij"
+    )
+    values = evaluate(data.zeff, data.radius, rpows, apows)
+    fit = fit_linear(values, data.reference)
+    return pd.DataFrame(
+        {
+            "rpow": rpows.ravel(),
+            "apow": apows.ravel(),
+            **{name: value.ravel() for name, value in fit._asdict().items()},
+        }
+    )
@@ -1,16 +1,30 @@
 """Utility functions to fetch data from the database in bulk"""
 
-from typing import List, Union
+from typing import Iterable, List, Union
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.dialects import sqlite
-from sqlalchemy import text
-
-from mendeleev import get_all_elements
-from mendeleev.electronegativity import allred_rochow, gordy, cottrell_sutton
-
-from .db import get_engine, get_session
-from .models import Element, IonizationEnergy
+from sqlalchemy import and_, text
+
+from .db import get_engine, get_shared_session
+from .econf import ElectronicConfiguration, valence_subshells
+from .electronegativity import (
+    allred_rochow,
+    cottrell_sutton,
+    gordy,
+    li_xue,
+    nagle,
+)
+from .ionization import ionization_energy_matrix, mulliken_matrix
+from .mendeleev import get_all_elements, get_attributes_for_all_elements
+from .models import (
+    IonicRadius,
+    IonizationEnergy,
+    occupation_table,
+    sanderson_all,
+    slater_zeff_table,
+)
 
 
 def fetch_table(table: str, **kwargs) -> pd.DataFrame:
@@ -58,67 +72,206 @@ def fetch_table(table: str, **kwargs) -> pd.DataFrame:
         return pd.read_sql_query(sql=text(query), con=conn, **kwargs)
 
 
+def _valence_data(
+    atomic_number: Iterable[int],
+    econf: Iterable[str],
+    block: Iterable[str],
+    period: Iterable[int],
+) -> pd.DataFrame:
+    """
+    Compute the valence principal quantum number, Slater's effective nuclear
+    charge and the numbers of valence electrons of the elements, as in
+    :py:meth:`Element.zeff <mendeleev.models.Element.zeff>` and
+    :py:meth:`Element.nvalence <mendeleev.models.Element.nvalence>`, the
+    effective nuclear charges are taken from
+    :py:func:`slater_zeff_table <mendeleev.models.slater_zeff_table>`.
+    """
+    index = np.asarray(atomic_number) - 1
+    max_n, max_l = valence_subshells(occupation_table()[index])
+    nvalence = []
+    for conf, b, p in zip(econf, block, period):
+        ec = ElectronicConfiguration(conf)
+        nvalence.append((ec.nvalence(b, p), ec.nvalence(b, p, method="simple")))
+    df = pd.DataFrame(nvalence, columns=["nvalence", "nvalence_simple"])
+    df.insert(0, "max_n", max_n)
+    df.insert(1, "zeff", slater_zeff_table()[index, max_n, max_l])
+    return df
+
+
+def _li_xue_table(radius: str = "crystal_radius") -> pd.DataFrame:
+    """
+    Compute the Li-Xue electronegativities for all the ions in the ionic radii
+    table with a single query joining the radii with the ionization energies of
+    the ions with one electron more.
+    """
+    if radius not in ["ionic_radius", "crystal_radius"]:
+        raise ValueError(
+            f"radius: '{radius}' not found, available values are: 'ionic_radius', 'crystal_radius'"
+        )
+
+    query = (
+        get_shared_session()
+        .query(
+            IonicRadius.atomic_number,
+            IonicRadius.charge,
+            IonicRadius.coordination,
+            IonicRadius.spin,
+            getattr(IonicRadius, radius),
+            IonizationEnergy.ionization_energy,
+        )
+        .outerjoin(
+            IonizationEnergy,
+            and_(
+                IonizationEnergy.atomic_number == IonicRadius.atomic_number,
+                IonizationEnergy.ion_charge == IonicRadius.charge - 1,
+            ),
+        )
+        .order_by(IonicRadius.id)
+    )
+    df = pd.read_sql_query(
+        query.statement.compile(dialect=sqlite.dialect()), get_engine()
+    )
+
+    elements = get_attributes_for_all_elements(["atomic_number", "econf"])
+    max_n = np.zeros(elements["atomic_number"].max() + 1, dtype=int)
+    max_n[elements["atomic_number"]] = [
+        ElectronicConfiguration(conf).max_n() for conf in elements["econf"]
+    ]
+    df["Li-Xue"] = li_xue(
+        df["ionization_energy"].to_numpy(dtype=float),
+        df[radius].to_numpy(dtype=float),
+        max_n[df["atomic_number"].to_numpy()],
+    )
+    return df
+
+
+def fetch_li_xue(radius: str = "crystal_radius") -> pd.DataFrame:
+    """
+    Fetch the Li-Xue electronegativities of all the ions as
+    :py:class:`pandas.DataFrame`
+
+    The values are computed for all the ions at once, as in
+    :py:meth:`Element.electronegativity_li_xue
+    <mendeleev.models.Element.electronegativity_li_xue>`, values for the ions
+    without an ionization energy are NaN.
+
+    Args:
+        radius: type of radius to be used in the calculation, either
+            `crystal_radius` as recommended in the paper or `ionic_radius`
+
+    Returns:
+        df (pandas.DataFrame): table indexed by atomic number, charge,
+            coordination and spin with the radius, ionization energy and
+            electronegativity columns
+    """
+    return (
+        _li_xue_table(radius)
+        .set_index(["atomic_number", "charge", "coordination", "spin"])
+        .sort_index()
+    )
+
+
 def fetch_electronegativities(scales: List[str] = None) -> pd.DataFrame:
     """
     Fetch electronegativity scales for all elements as :py:class:`pandas.DataFrame`
 
+    The scales are computed for all the elements at once from the database
+    tables without instantiating the elements.
+
     Args:
         scales: list of scale names, defaults to all available scales
 
     Returns:
         df (pandas.DataFrame): Pandas DataFrame with the contents of the table
     """
-    scales = [
-        "li-xue",
-        "martynov-batsanov",
-        "mulliken",
-        "nagle",
-        "sanderson",
-    ]
+    columns = {
+        "symbol": "symbol",
+        "covalent_radius_pyykko": "radius",
+        "en_allen": "Allen",
+        "en_ghosh": "Ghosh",
+        "en_gunnarsson_lundqvist": "Gunnarsson-Lundqvist",
+        "en_miedema": "Miedema",
+        "en_mullay": "Mullay",
+        "en_pauling": "Pauling",
+        "en_robles_bartolotti": "Robles-Bartolotti",
+    }
+    extra = ["econf", "block", "period", "dipole_polarizability"]
+    data = get_attributes_for_all_elements(list(columns) + extra, as_="pandas")
+    df = data.loc[:, list(columns)].rename(columns=columns)
 
-    session = get_session()
-    engine = get_engine()
+    valence = _valence_data(data.index, data["econf"], data["block"], data["period"])
+    valence.index = data.index
+    ie = ionization_energy_matrix()[data.index - 1]
 
-    query = session.query(
-        Element.atomic_number,
-        Element.symbol,
-        Element.covalent_radius_pyykko.label("radius"),
-        Element.en_allen.label("Allen"),
-        Element.en_ghosh.label("Ghosh"),
-        Element.en_gunnarsson_lundqvist.label("Gunnarsson-Lundqvist"),
-        Element.en_miedema.label("Miedema"),
-        Element.en_mullay.label("Mullay"),
-        Element.en_pauling.label("Pauling"),
-        Element.en_robles_bartolotti.label("Robles-Bartolotti"),
-    ).order_by("atomic_number")
-    df = pd.read_sql_query(query.statement.compile(dialect=sqlite.dialect()), engine)
-
-    elems = get_all_elements()
-
-    df.loc[:, "zeff"] = [e.zeff() for e in elems]
+    df.loc[:, "zeff"] = valence["zeff"]
     # scales
     df.loc[:, "Allred-Rochow"] = allred_rochow(df["zeff"], df["radius"])
     df.loc[:, "Cottrell-Sutton"] = cottrell_sutton(df["zeff"], df["radius"])
     df.loc[:, "Gordy"] = gordy(df["zeff"], df["radius"])
 
-    for scale in scales:
-        scale_name = "-".join(s.capitalize() for s in scale.split("-"))
-        df.loc[:, scale_name] = [e.electronegativity(scale=scale) for e in elems]
-    return df.set_index("atomic_number")
+    li_xue_values = {z: {} for z in data.index}
+    cations = _li_xue_table().query("charge == 1")
+    for z, coordination, spin, value in cations[
+        ["atomic_number", "coordination", "spin", "Li-Xue"]
+    ].itertuples(index=False):
+        li_xue_values[z][(coordination, spin)] = value
+    df["Li-Xue"] = pd.Series(li_xue_values)
+
+    # average of the valence ionization energies, undefined if any is missing
+    nvalence = valence["nvalence_simple"].to_numpy()
+    is_valence = np.arange(ie.shape[1]) < nvalence[:, np.newaxis]
+    valence_ie = np.where(is_valence, ie, 0.0)
+    complete = ~np.any(is_valence & (np.isnan(ie) | (ie == 0.0)), axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        df.loc[:, "Martynov-Batsanov"] = np.where(
+            complete, np.sqrt(valence_ie.sum(axis=1) / nvalence), np.nan
+        )
+
+    df.loc[:, "Mulliken"] = mulliken_matrix()[data.index - 1, 0]
+    df.loc[:, "Nagle"] = nagle(valence["nvalence"], data["dipole_polarizability"])
+
+    df.loc[:, "Sanderson"] = sanderson_all("covalent_radius_pyykko")
+
+    return df
+
 
+# columns of the ionizationenergies table that can be fetched with the energies
+IONIZATION_ENERGY_FLAGS = ("uncertainty", "is_theoretical", "is_semi_empirical")
 
-def fetch_ionization_energies(degree: Union[List[int], int] = 1) -> pd.DataFrame:
+
+def fetch_ionization_energies(
+    degree: Union[List[int], int] = 1,
+    long: bool = False,
+    include: Iterable[str] = (),
+) -> pd.DataFrame:
     """
-    Fetch a :py:class:`pandas.DataFrame` with ionization energies for all elements
-    indexed by atomic number.
+    Fetch a :py:class:`pandas.DataFrame` with ionization energies for all elements.
 
     Args:
         degree: Degree of ionization, either as int or a list of ints. If a list is
             passed then the output will contain ionization energies corresponding
             to particalr degrees in columns.
+        long: If `True` return a tidy table with one row per element and degree
+            with `atomic_number`, `degree` and `ionization_energy` columns
+            including only the available energies.
+        include: Additional columns of the ``ionizationenergies`` table, any of
+            `uncertainty`, `is_theoretical` and `is_semi_empirical`. In the wide
+            format they are returned as ``IE<degree>_<column>`` columns next to
+            the energies.
 
     Returns:
-        df (pandas.DataFrame): ionization energies, indexed by atomic number
+        df (pandas.DataFrame): ionization energies, in the wide format indexed
+            by atomic number with one ``IE<degree>`` column per degree followed
+            by its ``IE<degree>_<column>`` columns, in the long format with a
+            default integer index and `atomic_number`, `degree`,
+            `ionization_energy` and the `include` columns sorted by atomic
+            number and degree
+
+    Example:
+        >>> from mendeleev.fetch import fetch_ionization_energies
+        >>> df = fetch_ionization_energies([1, 2], include=["uncertainty"])
+        >>> list(df.columns)
+        ['IE1', 'IE1_uncertainty', 'IE2', 'IE2_uncertainty']
     """
 
     # validate degree
@@ -134,28 +287,52 @@ def fetch_ionization_energies(degree: Union[List[int], int] = 1) -> pd.DataFrame
             f"degree should be either a positive int or a collection of positive ints, got: {degree}"
         )
 
-    session = get_session()
-    engine = get_engine()
-
-    query = session.query(Element.atomic_number).order_by("atomic_number")
-    df = pd.read_sql_query(query.statement.compile(dialect=sqlite.dialect()), engine)
-
-    for d in degree:
-        query = session.query(IonizationEnergy).filter(IonizationEnergy.degree == d)
-        energies = pd.read_sql_query(
-            query.statement.compile(dialect=sqlite.dialect()), engine
+    include = list(include)
+    unknown = [c for c in include if c not in IONIZATION_ENERGY_FLAGS]
+    if unknown:
+        raise ValueError(
+            f"columns not found: {', '.join(unknown)}, available columns are: "
+            f"{', '.join(IONIZATION_ENERGY_FLAGS)}"
         )
 
-        df = pd.merge(
-            df,
-            energies.loc[:, ["atomic_number", "ionization_energy"]].rename(
-                columns={"ionization_energy": "IE{0:d}".format(d)}
-            ),
-            on="atomic_number",
-            how="left",
+    matrix = ionization_energy_matrix()
+    index = pd.RangeIndex(1, matrix.shape[0] + 1, name="atomic_number")
+
+    if not long and not include:
+        missing = np.full(matrix.shape[0], np.nan)
+        columns = {
+            "IE{0:d}".format(d): matrix[:, d - 1] if d <= matrix.shape[1] else missing
+            for d in degree
+        }
+        return pd.DataFrame(columns, index=index)
+
+    query = (
+        get_shared_session()
+        .query(
+            IonizationEnergy.atomic_number,
+            IonizationEnergy.degree.label("degree"),
+            IonizationEnergy.ionization_energy,
+            *[getattr(IonizationEnergy, c) for c in include],
         )
+        .filter(IonizationEnergy.ion_charge.in_([d - 1 for d in degree]))
+        .order_by(IonizationEnergy.atomic_number, IonizationEnergy.ion_charge)
+    )
+    df = pd.read_sql_query(
+        query.statement.compile(dialect=sqlite.dialect()), get_engine()
+    )
+    if long:
+        return df
 
-    return df.set_index("atomic_number")
+    values = ["ionization_energy"] + include
+    columns = [(v, d) for d in dict.fromkeys(degree) for v in values]
+    wide = df.pivot(index="atomic_number", columns="degree", values=values).reindex(
+        index=index, columns=pd.MultiIndex.from_tuples(columns)
+    )
+    wide.columns = [
+        "IE{0:d}".format(d) if v == "ionization_energy" else f"IE{d:d}_{v}"
+        for v, d in columns
+    ]
+    return wide.infer_objects()
 
 
 def fetch_neutral_data() -> pd.DataFrame:
@@ -190,7 +367,10 @@ def fetch_neutral_data() -> pd.DataFrame:
     elements.loc[:, "hardness"] = [e.hardness() for e in ELEMS]
     elements.loc[:, "softness"] = [e.softness() for e in ELEMS]
     elements.loc[:, "mass"] = [e.mass_str() for e in ELEMS]
-    elements.loc[:, "zeff_slater"] = [e.zeff(method="slater") for e in ELEMS]
+    occupations = occupation_table()
+    max_n, max_l = valence_subshells(occupations)
+    zeff_slater = slater_zeff_table()[np.arange(occupations.shape[0]), max_n, max_l]
+    elements.loc[:, "zeff_slater"] = zeff_slater[elements["atomic_number"] - 1]
     elements.loc[:, "zeff_clementi"] = [e.zeff(method="clementi") for e in ELEMS]
 
     ens = fetch_electronegativities()
@@ -0,0 +1,163 @@
+r"""
+Ionization energies of all the elements and ions as a dense matrix and the
+conceptual DFT descriptors derived from them computed for all the elements and
+charges at once.
+
+The matrix rows correspond to atomic numbers and the columns to ion charges
+so that ``matrix[Z - 1, q]`` is the energy in eV required to remove an electron
+from the ion of element ``Z`` with charge ``q``, i.e. the ionization energy of
+degree ``q + 1``. Missing values are NaN.
+
+The descriptors follow the definitions used by
+:py:meth:`Element.hardness <mendeleev.models.Element.hardness>` and related
+methods where for the neutral atoms (:math:`q = 0`) the electron affinity
+:math:`A` is the electron affinity of the element and for the cations it is the
+ionization energy of the ion with charge :math:`q - 1`.
+
+Examples:
+
+>>> from mendeleev.ionization import hardness_matrix
+>>> eta = hardness_matrix()
+>>> float(round(eta[25, 0], 4))  # Fe
+3.8757
+"""
+
+from __future__ import annotations
+import threading
+
+import numpy as np
+
+from .db import cache_token, get_shared_session
+from .mendeleev import get_attributes_for_all_elements
+from .models import IonizationEnergy
+
+
+__all__ = [
+    "electrophilicity_matrix",
+    "hardness_matrix",
+    "ionization_energy_matrix",
+    "mulliken_matrix",
+    "softness_matrix",
+]
+
+
+_lock = threading.Lock()
+_matrix = None
+_token = None
+
+
+def _build_matrix() -> np.ndarray:
+    "Load the ionization energies table into a dense matrix"
+    atomic_numbers = get_attributes_for_all_elements("atomic_number")["atomic_number"]
+    size = int(atomic_numbers.max())
+    rows = (
+        get_shared_session()
+        .query(
+            IonizationEnergy.atomic_number,
+            IonizationEnergy.ion_charge,
+            IonizationEnergy.ionization_energy,
+        )
+        .all()
+    )
+    data = np.array(rows, dtype=float).reshape(-1, 3)
+    z, q = data[:, 0].astype(np.intp), data[:, 1].astype(np.intp)
+    matrix = np.full((size, size), np.nan)
+    matrix[z - 1, q] = data[:, 2]
+    matrix.setflags(write=False)
+    return matrix
+
+
+def ionization_energy_matrix() -> np.ndarray:
+    """
+    Return the read-only matrix of ionization energies in eV indexed by
+    ``[atomic_number - 1, ion_charge]``.
+
+    The matrix is built with a single query on first use and rebuilt whenever
+    the database token changes, see :py:func:`mendeleev.db.cache_token`.
+    """
+    global _matrix, _token
+    token = cache_token()
+    if token != _token:
+        with _lock:
+            if token != _token:
+                _matrix = _build_matrix()
+                _token = token
+    return _matrix
+
+
+def _affinity_matrix() -> np.ndarray:
+    """
+    Return the energies released on adding an electron to the species in the
+    ionization energy matrix, the electron affinity for the neutral atoms and the
+    ionization energy of the ion with one electron more for the cations.
+    """
+    ie = ionization_energy_matrix()
+    ea = get_attributes_for_all_elements("electron_affinity")["electron_affinity"]
+    affinity = np.empty_like(ie)
+    affinity[:, 0] = ea
+    affinity[:, 1:] = ie[:, :-1]
+    return affinity
+
+
+def hardness_matrix() -> np.ndarray:
+    r"""
+    Return the absolute hardness of all the elements and ions
+
+    .. math::
+
+       \eta = \frac{I - A}{2}
+
+    Returns:
+        matrix indexed by ``[atomic_number - 1, charge]``, NaN where undefined
+    """
+    return (ionization_energy_matrix() - _affinity_matrix()) * 0.5
+
+
+def softness_matrix() -> np.ndarray:
+    r"""
+    Return the absolute softness of all the elements and ions
+
+    .. math::
+
+       S = \frac{1}{2\eta}
+
+    Returns:
+        matrix indexed by ``[atomic_number - 1, charge]``, NaN where undefined
+    """
+    with np.errstate(divide="ignore"):
+        return 1.0 / (2.0 * hardness_matrix())
+
+
+def mulliken_matrix() -> np.ndarray:
+    r"""
+    Return the absolute (Mulliken) electronegativity of all the elements and ions
+
+    .. math::
+
+       \chi = \frac{I + A}{2}
+
+    where the missing electron affinities are treated as zero, as in
+    :py:func:`mendeleev.electronegativity.mulliken`.
+
+    Returns:
+        matrix indexed by ``[atomic_number - 1, charge]``, NaN where undefined
+    """
+    affinity = np.nan_to_num(_affinity_matrix(), nan=0.0)
+    return (ionization_energy_matrix() + affinity) * 0.5
+
+
+def electrophilicity_matrix() -> np.ndarray:
+    r"""
+    Return the electrophilicity index of all the elements and ions
+
+    .. math::
+
+       \omega = \frac{(I + A)^2}{8(I - A)}
+
+    Returns:
+        matrix indexed by ``[atomic_number - 1, charge]``, NaN where undefined
+    """
+    ie = ionization_energy_matrix()
+    affinity = _affinity_matrix()
+    with np.errstate(divide="ignore"):
+        return (ie + affinity) ** 2 / (8.0 * (ie - affinity))
@@ -1,33 +1,233 @@
 """Entry point for the Mendeleev package for instantiating elements and isotopes."""
 
-from typing import List, Union
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Union
+import threading
 
+import numpy as np
 import sqlalchemy
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, undefer_group
 
-from .db import get_session, get_engine
+from .db import cache_token, get_shared_session
 from .models import Element, Isotope
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 __all__ = [
     "get_all_elements",
     "get_attribute_for_all_elements",
+    "gather",
+    "gather_many",
+    "get_attributes_for_all_elements",
     "element",
     "isotope",
+    "resolve",
+    "resolve_many",
 ]
 
 
-def element(ids: Union[int, str]) -> Element:
+# relationships of Element that can be loaded upfront, public name -> attribute
+RELATIONSHIPS = {
+    "ionic_radii": "ionic_radii",
+    "ionization_energies": "_ionization_energies",
+    "isotopes": "isotopes",
+    "oxidation_states": "_oxidation_states",
+    "phase_transitions": "phase_transitions",
+    "scattering_factors": "scattering_factors",
+    "screening_constants": "screening_constants",
+}
+
+# groups of deferred Element columns that can be loaded upfront
+DEFERRED_GROUPS = ("text",)
+
+# named sets of relationships and column groups loaded together with the elements
+LOAD_PROFILES = {
+    "minimal": (),
+    "default": tuple(r for r in RELATIONSHIPS if r != "scattering_factors"),
+    "full": tuple(RELATIONSHIPS) + DEFERRED_GROUPS,
+}
+
+# maximal number of Element instances kept by the `element` cache
+ELEMENT_CACHE_SIZE = 128
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _ElementCache:
+    """
+    Bounded LRU cache of :py:class:`Element <mendeleev.models.Element>`
+    instances keyed by the session and atomic number.
+
+    Identifiers are resolved to atomic numbers with :py:func:`resolve` so that
+    all of them return the same instance. Instances are bound to the shared
+    session of the thread that loaded them, see
+    :py:func:`mendeleev.db.get_shared_session`, and are only returned to the
+    callers using the same session. The cache is cleared whenever the database
+    token changes.
+    """
+
+    def __init__(self, maxsize: int = ELEMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._elements = OrderedDict()
+        self._token = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _validate(self) -> None:
+        token = cache_token()
+        if token != self._token:
+            self._elements.clear()
+            self._token = token
+
+    def get(self, atomic_number: int, session: Session) -> Union[Element, None]:
+        "Return the element with the `atomic_number` cached for `session` or None"
+        key = (id(session), atomic_number)
+        with self._lock:
+            self._validate()
+            elem = self._elements.get(key)
+            # instances whose session is gone cannot load their relationships
+            if elem is None or sqlalchemy.inspect(elem).session is not session:
+                self.misses += 1
+                return None
+            self._elements.move_to_end(key)
+            self.hits += 1
+            return elem
+
+    def put(self, elem: Element) -> None:
+        "Store the `elem` in the cache evicting the least recently used if full"
+        key = (id(sqlalchemy.inspect(elem).session), elem.atomic_number)
+        with self._lock:
+            self._validate()
+            self._elements[key] = elem
+            self._elements.move_to_end(key)
+            while len(self._elements) > self.maxsize:
+                self._elements.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        "Report the cache statistics"
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._elements))
+
+    def cache_clear(self) -> None:
+        "Clear the cache and statistics"
+        with self._lock:
+            self._elements.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_element_cache = _ElementCache()
+
+
+@lru_cache(maxsize=None)
+def _loader_names(load: Union[str, tuple]) -> tuple:
+    "Return the names of the relationships and column groups selected by `load`"
+    if isinstance(load, str):
+        if load not in LOAD_PROFILES:
+            raise ValueError(
+                f"load profile '{load}' not found, available profiles are: "
+                f"{', '.join(LOAD_PROFILES)}"
+            )
+        return LOAD_PROFILES[load]
+
+    unknown = [
+        name
+        for name in load
+        if name not in RELATIONSHIPS and name not in DEFERRED_GROUPS
+    ]
+    if unknown:
+        raise ValueError(
+            f"relationships not found: {', '.join(unknown)}, available are: "
+            f"{', '.join(list(RELATIONSHIPS) + list(DEFERRED_GROUPS))}"
+        )
+    return load
+
+
+@lru_cache(maxsize=None)
+def _loader_options(names: tuple) -> tuple:
+    "Return the query options loading the relationships and column groups"
+    return tuple(
+        undefer_group(n)
+        if n in DEFERRED_GROUPS
+        else selectinload(getattr(Element, RELATIONSHIPS[n]))
+        for n in names
+    )
+
+
+@lru_cache(maxsize=None)
+def _loaded_attributes(name: str) -> frozenset:
+    "Return the attribute keys loaded by the relationship or column group `name`"
+    if name in DEFERRED_GROUPS:
+        return frozenset(
+            prop.key
+            for prop in sqlalchemy.inspect(Element).column_attrs
+            if prop.group == name
+        )
+    return frozenset([RELATIONSHIPS[name]])
+
+
+def _load_unloaded(session: Session, elements: List[Element], names: tuple) -> None:
+    """
+    Load the relationships and column groups `names` that are not loaded yet
+    into the cached `elements`
+    """
+    pending = {}
+    for elem in elements:
+        unloaded = sqlalchemy.inspect(elem).unloaded
+        missing = tuple(
+            n for n in names if not _loaded_attributes(n).isdisjoint(unloaded)
+        )
+        if missing:
+            pending.setdefault(missing, set()).add(elem.atomic_number)
+
+    # instances already in the identity map get their unloaded attributes filled
+    for missing, atomic_numbers in pending.items():
+        session.query(Element).options(*_loader_options(missing)).filter(
+            Element.atomic_number.in_(atomic_numbers)
+        ).all()
+
+
+def _normalize_load(load: Union[str, Iterable[str]]) -> Union[str, tuple]:
+    "Make the `load` argument hashable"
+    return load if isinstance(load, str) else tuple(load)
+
+
+def element(
+    ids: Union[int, str], load: Union[str, Iterable[str]] = "default"
+) -> Element:
     """
     Based on the type of the `ids` identifier return either an
     :py:class:`Element <mendeleev.models.Element>` object from the
     database, or a list of :py:class:`Element <mendeleev.models.Element>`
     objects if the `ids` is a list or a tuple of identifiers. Valid
     identifiers for an element are: *name*, *symbol*, and
-    *atomic number*.
+    *atomic number*, see :py:func:`resolve`.
+
+    The elements are bound to the shared session of the calling thread, see
+    :py:func:`mendeleev.db.get_shared_session`, which loads the relationships
+    and columns that were not loaded upfront. Sessions are not thread-safe, so
+    the elements should not be shared between threads, call `element` in each
+    thread instead or load everything upfront with ``load="full"``. The
+    attribute access ``mendeleev.Fe`` calls `element` every time and follows
+    the same rule. Use :py:mod:`mendeleev.snapshot` for immutable copies that
+    can be shared between threads and processes.
 
     Args:
         ids (str): element identifier
+        load (str or list): relationships loaded together with the element,
+            either a name of a profile:
+
+            - `minimal` - no relationships
+            - `default` - all relationships except `scattering_factors`
+            - `full` - all relationships and the deferred text columns
+
+            or a list of relationship names, see ``RELATIONSHIPS``, and
+            deferred column groups, see ``DEFERRED_GROUPS``. The relationships
+            and columns that are not loaded upfront are loaded on first access.
 
     Raises:
         ValueError: when the identifier is not a list/tuple, int or str
@@ -59,44 +259,97 @@ def element(ids: Union[int, str]) -> Element:
         >>> print(c.name, h.name, o.name)
         Carbon Hydrogen Oxygen
 
+        The elements are cached so all the identifiers return the same instance,
+        use ``element.cache_info()`` and ``element.cache_clear()`` to inspect and
+        clear the cache
+
+        >>> element('Fe') is element(26)
+        True
+
     """
+    names = _loader_names(_normalize_load(load))
     if isinstance(ids, (list, tuple)):
-        return [_get_element(i) for i in ids]
-    elif isinstance(ids, (str, int)):
-        return _get_element(ids)
+        return _get_elements(ids, load=names)
+    elif isinstance(ids, (str, int, np.integer)):
+        return _get_element(ids, load=names)
     else:
         raise ValueError(
-            "Expected a <list>, <tuple>, <str> or <int>, got: {0:s}".format(type(ids))
+            "Expected a <list>, <tuple>, <str> or <int>, got: {0}".format(type(ids))
         )
 
 
-def _get_element(ids) -> Union[Element, List[Element]]:
+element.cache_info = _element_cache.cache_info
+element.cache_clear = _element_cache.cache_clear
+
+
+def _get_element(ids, load: tuple = ()) -> Union[Element, List[Element]]:
     """
-    Return an element from the database based on the `ids` identifier passed.
-    Valid identifiers for an element are: *name*, *symbol*, *atomic number*.
+    Return an element from the cache or the database based on the `ids`
+    identifier passed. Valid identifiers for an element are: *name*, *symbol*,
+    *atomic number*.
     """
 
-    session = get_session()
+    atomic_number = resolve(ids)
+    session = get_shared_session()
+    cached = _element_cache.get(atomic_number, session)
+    if cached is not None:
+        _load_unloaded(session, [cached], load)
+        return cached
 
-    try:
-        if isinstance(ids, str):
-            if len(ids) <= 3 and ids.lower() != "tin":
-                return session.query(Element).filter(Element.symbol == str(ids)).one()
-            else:
-                return session.query(Element).filter(Element.name == str(ids)).one()
-        elif isinstance(ids, int):
-            return session.query(Element).filter(Element.atomic_number == ids).one()
-        raise ValueError("Expecting a <str> or <int>, got: {0:s}".format(type(ids)))
-    except sqlalchemy.exc.NoResultFound:
-        raise ValueError(f"Element not found: {ids}")
+    elem = (
+        session.query(Element)
+        .options(*_loader_options(load))
+        .filter(Element.atomic_number == atomic_number)
+        .one()
+    )
+    _element_cache.put(elem)
+    return elem
+
+
+def _get_elements(ids: Union[List, tuple], load: tuple = ()) -> List[Element]:
+    """
+    Return a list of elements for a collection of identifiers preserving the
+    order and duplicates. Elements missing from the cache are loaded with a
+    single query.
+    """
 
+    atomic_numbers = resolve_many(ids)
+    session = get_shared_session()
+    resolved = {}
+    for atomic_number in atomic_numbers:
+        cached = _element_cache.get(atomic_number, session)
+        if cached is not None:
+            resolved[atomic_number] = cached
+    _load_unloaded(session, list(resolved.values()), load)
 
-def get_all_elements() -> List[Element]:
-    "Get all elements as a list"
+    missing = set(atomic_numbers).difference(resolved)
+    if missing:
+        query = session.query(Element).options(*_loader_options(load))
+        for elem in query.filter(Element.atomic_number.in_(missing)).all():
+            _element_cache.put(elem)
+            resolved[elem.atomic_number] = elem
 
-    session = get_session()
-    elements = session.query(Element).all()
-    session.close()
+    return [resolved[z] for z in atomic_numbers]
+
+
+def get_all_elements(load: Union[str, Iterable[str]] = "default") -> List[Element]:
+    """
+    Get all elements as a list
+
+    Args:
+        load (str or list): relationships loaded together with the elements,
+            see :py:func:`element` for details
+    """
+
+    session = get_shared_session()
+    elements = (
+        session.query(Element)
+        .options(*_loader_options(_loader_names(_normalize_load(load))))
+        .order_by(Element.atomic_number)
+        .all()
+    )
+    for elem in elements:
+        _element_cache.put(elem)
     return elements
 
 
@@ -106,30 +359,18 @@ def isotope(symbol_or_atn: Union[str, int], mass_number: int) -> Isotope:
     and mass number.
 
     Args:
-        symbol_or_atn (str or int): either element symbol or atomic number
+        symbol_or_atn (str or int): element identifier, see :py:func:`resolve`
         mass_number (int): mass number of the isotope
 
     Returns:
         isotope (Isotope): isotope instance
     """
-    session = get_session()
-    if isinstance(symbol_or_atn, int):
-        return (
-            session.query(Isotope)
-            .filter_by(atomic_number=symbol_or_atn, mass_number=mass_number)
-            .one()
-        )
-    elif isinstance(symbol_or_atn, str):
-        return (
-            session.query(Isotope)
-            .join(Element)
-            .filter(Element.symbol == symbol_or_atn, Isotope.mass_number == mass_number)
-            .one()
-        )
-    else:
-        raise ValueError(
-            "Expecting a <str> or <int>, got: {0:s}".format(type(symbol_or_atn))
-        )
+    return (
+        get_shared_session()
+        .query(Isotope)
+        .filter_by(atomic_number=resolve(symbol_or_atn), mass_number=mass_number)
+        .one()
+    )
 
 
 def ids_to_attr(ids, attr: str = "atomic_number"):
@@ -149,10 +390,11 @@ def ids_to_attr(ids, attr: str = "atomic_number"):
         List of attributes corresponding to the ids
     """
 
-    if isinstance(ids, (list, tuple)):
-        return [getattr(e, attr) for e in element(ids)]
-    else:
-        return [getattr(element(ids), attr)]
+    if not isinstance(ids, (list, tuple)):
+        ids = [ids]
+    if attr == "atomic_number":
+        return resolve_many(ids)
+    return [getattr(e, attr) for e in element(ids)]
 
 
 def deltaN(
@@ -178,7 +420,7 @@ def deltaN(
         Element identifier atomic number, symbol or element name
     """
 
-    session = get_session()
+    session = get_shared_session()
     atns = ids_to_attr([id1, id2], attr="atomic_number")
 
     e1, e2 = [
@@ -202,11 +444,329 @@ def get_attribute_for_all_elements(attribute: str) -> List:
     """
     Get a list of from a single attribute of all elements in the database.
     """
-    engine = get_engine()
-    with Session(engine) as session:
-        return [
-            getattr(r, attribute)
-            for r in session.query(getattr(Element, attribute))
+    session = get_shared_session()
+    return [
+        getattr(r, attribute)
+        for r in session.query(getattr(Element, attribute))
+        .order_by(Element.atomic_number)
+        .all()
+    ]
+
+
+class _PropertyTable:
+    """
+    Dense, column oriented copy of the ``elements`` table.
+
+    Every column is stored as a read-only array with one row per atomic number
+    and a padding row 0 so that the arrays can be indexed with atomic numbers
+    directly. Float columns store NULL values as NaN, integer and boolean
+    columns keep their type unless they contain NULL values in which case they
+    are stored as floats with NaN. The table is loaded with a single query on
+    first use and rebuilt whenever the database token changes.
+    """
+
+    def __init__(self):
+        self._arrays = {}
+        self._values = {}
+        self._atomic_numbers = None
+        self._known = None
+        self._token = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        columns = [
+            attr
+            for attr in sqlalchemy.inspect(Element).column_attrs
+            if not attr.key.startswith("_")
+        ]
+        rows = (
+            get_shared_session()
+            .query(*[getattr(Element, attr.key) for attr in columns])
             .order_by(Element.atomic_number)
             .all()
-        ]
+        )
+        atomic_numbers = np.array([r.atomic_number for r in rows], dtype=np.intp)
+        size = atomic_numbers.max() + 1
+        arrays, values = {}, {}
+        for i, attr in enumerate(columns):
+            column = [r[i] for r in rows]
+            python_type = attr.columns[0].type.python_type
+            if python_type in (int, bool) and None not in column:
+                array = np.zeros(size, dtype=np.int64 if python_type is int else bool)
+                array[atomic_numbers] = column
+            elif python_type in (int, bool, float):
+                array = np.full(size, np.nan)
+                array[atomic_numbers] = [np.nan if v is None else v for v in column]
+            else:
+                array = np.full(size, None, dtype=object)
+                array[atomic_numbers] = column
+            array.setflags(write=False)
+            arrays[attr.key] = array
+            values[attr.key] = column
+        known = np.zeros(size, dtype=bool)
+        known[atomic_numbers] = True
+        atomic_numbers.setflags(write=False)
+        self._arrays, self._values = arrays, values
+        self._known = known
+        self._atomic_numbers = atomic_numbers
+
+    def _validate(self) -> None:
+        token = cache_token()
+        if token != self._token:
+            with self._lock:
+                if token != self._token:
+                    self._load()
+                    self._token = token
+
+    def _check(self, attributes: Iterable[str]) -> None:
+        unknown = [a for a in attributes if a not in self._arrays]
+        if unknown:
+            raise ValueError(f"Unknown element attributes: {', '.join(unknown)}")
+
+    @property
+    def atomic_numbers(self) -> np.ndarray:
+        "Atomic numbers of all the elements in ascending order"
+        self._validate()
+        return self._atomic_numbers
+
+    def arrays(self, attributes: Iterable[str]) -> Dict[str, np.ndarray]:
+        "Return the padded arrays of the `attributes` indexed by atomic number"
+        self._validate()
+        self._check(attributes)
+        return {a: self._arrays[a] for a in attributes}
+
+    def take(
+        self, atomic_numbers: Any, attributes: Iterable[str]
+    ) -> Dict[str, np.ndarray]:
+        "Return the values of the `attributes` for every atomic number"
+        arrays = self.arrays(attributes)
+        z = np.asarray(atomic_numbers)
+        if z.size == 0:
+            z = z.astype(np.intp)
+        elif z.dtype.kind not in "iu":
+            raise ValueError(f"Expected integer atomic numbers, got: {z.dtype}")
+        inside = (z >= 0) & (z < self._known.size)
+        valid = np.zeros(z.shape, dtype=bool)
+        valid[inside] = self._known[z[inside]]
+        if not valid.all():
+            unknown = np.unique(z[~valid])
+            raise ValueError(
+                f"Unknown atomic numbers: {', '.join(str(u) for u in unknown[:10])}"
+                + (", ..." if unknown.size > 10 else "")
+            )
+        return {name: np.take(array, z) for name, array in arrays.items()}
+
+    def values(self, attributes: Iterable[str]) -> Dict[str, List[Any]]:
+        "Return the values of the `attributes` ordered by atomic number"
+        self._validate()
+        self._check(attributes)
+        return {a: list(self._values[a]) for a in attributes}
+
+
+_property_table = _PropertyTable()
+
+
+# alternate spellings of the element names, lowercase alias -> name
+ELEMENT_ALIASES = {
+    "aluminium": "Aluminum",
+    "caesium": "Cesium",
+    "sulphur": "Sulfur",
+    "wolfram": "Tungsten",
+}
+
+
+class _IdentifierIndex:
+    """
+    Index mapping the element identifiers to atomic numbers.
+
+    Symbols, names and the alternate spellings in ``ELEMENT_ALIASES`` are
+    matched case-insensitively. The index is built from the in-memory copy of
+    the ``elements`` table on first use and rebuilt whenever the database
+    token changes.
+    """
+
+    def __init__(self):
+        self._numbers = {}
+        self._strings = {}
+        self._token = None
+        self._lock = threading.Lock()
+
+    def _validate(self) -> None:
+        token = cache_token()
+        if token != self._token:
+            with self._lock:
+                if token != self._token:
+                    self._build()
+                    self._token = token
+
+    def _build(self) -> None:
+        data = _property_table.values(["atomic_number", "symbol", "name"])
+        numbers = {z: z for z in data["atomic_number"]}
+        strings = {}
+        for z, symbol, name in zip(*data.values()):
+            strings[symbol.lower()] = z
+            strings[name.lower()] = z
+        for alias, name in ELEMENT_ALIASES.items():
+            strings[alias] = strings[name.lower()]
+        self._numbers, self._strings = numbers, strings
+
+    def get(self, ids: Union[int, str]) -> Union[int, None]:
+        "Return the atomic number for the `ids` identifier or None if not found"
+        self._validate()
+        if isinstance(ids, str):
+            return self._strings.get(ids.strip().lower())
+        elif isinstance(ids, (int, np.integer)):
+            return self._numbers.get(int(ids))
+        else:
+            raise ValueError("Expecting a <str> or <int>, got: {0}".format(type(ids)))
+
+
+_identifier_index = _IdentifierIndex()
+
+
+def resolve(ids: Union[int, str]) -> int:
+    """
+    Return the atomic number of the element identified by `ids`.
+
+    Valid identifiers are atomic numbers, symbols, names and the alternate
+    spellings of names listed in ``ELEMENT_ALIASES``, strings are matched
+    case-insensitively.
+
+    Raises:
+        ValueError: when the element is not found or the identifier is not
+            a str or int
+
+    Example:
+
+        >>> from mendeleev import resolve
+        >>> resolve("Caesium")
+        55
+    """
+    atomic_number = _identifier_index.get(ids)
+    if atomic_number is None:
+        raise ValueError(f"Element not found: {ids}")
+    return atomic_number
+
+
+def resolve_many(ids: Iterable[Union[int, str]]) -> List[int]:
+    """
+    Return the atomic numbers of the elements identified by `ids`.
+
+    The identifiers are resolved in memory without querying the database, see
+    :py:func:`resolve` for the valid identifiers.
+
+    Raises:
+        ValueError: listing all the identifiers that were not found
+
+    Example:
+
+        >>> from mendeleev import resolve_many
+        >>> resolve_many(["H", "carbon", 8, "Sulphur"])
+        [1, 6, 8, 16]
+    """
+    ids = list(ids)
+    atomic_numbers = [_identifier_index.get(i) for i in ids]
+    missing = [i for i, z in zip(ids, atomic_numbers) if z is None]
+    if missing:
+        missing = dict.fromkeys(missing)
+        raise ValueError(f"Element not found: {', '.join(str(i) for i in missing)}")
+    return atomic_numbers
+
+
+def get_attributes_for_all_elements(
+    attributes: Union[str, Iterable[str]], as_: str = "numpy"
+) -> Union[Dict[str, np.ndarray], Dict[str, List], "pd.DataFrame"]:
+    """
+    Get the values of many attributes of all elements in the database.
+
+    The values come from an in-memory copy of the ``elements`` table that is
+    loaded with a single query on first use and shared by all the calls.
+
+    Args:
+        attributes (str or list): names of the :py:class:`Element
+            <mendeleev.models.Element>` columns
+        as_ (str): output format:
+
+            - `numpy` - dict of arrays ordered by atomic number, NULL
+              values are NaN, integer and boolean columns without NULL values
+              keep their type
+            - `dict` - dict of lists ordered by atomic number, NULL values are None
+            - `pandas` - :py:class:`pandas.DataFrame` indexed by atomic number
+
+    Raises:
+        ValueError: when an attribute or output format is not recognized
+
+    Example:
+
+        >>> from mendeleev import get_attributes_for_all_elements
+        >>> data = get_attributes_for_all_elements(["atomic_weight", "period"])
+        >>> data["period"][:4]
+        array([1, 1, 2, 2])
+    """
+    if isinstance(attributes, str):
+        attributes = [attributes]
+    attributes = list(attributes)
+
+    if as_ == "numpy":
+        return {
+            name: array[_property_table.atomic_numbers]
+            for name, array in _property_table.arrays(attributes).items()
+        }
+    elif as_ == "dict":
+        return _property_table.values(attributes)
+    elif as_ == "pandas":
+        import pandas as pd
+
+        data = _property_table.values(attributes)
+        index = pd.Index(_property_table.atomic_numbers, name="atomic_number")
+        return pd.DataFrame(data, index=index, columns=attributes)
+    else:
+        raise ValueError(
+            f"Unknown output format: {as_}, expected one of: numpy, dict, pandas"
+        )
+
+
+def gather(atomic_numbers: Any, attribute: str) -> np.ndarray:
+    """
+    Map an array of atomic numbers to the values of an element attribute.
+
+    The values are taken from an in-memory copy of the ``elements`` table, see
+    :py:func:`get_attributes_for_all_elements`, so arrays with millions of
+    atoms are handled without a loop over elements.
+
+    Args:
+        atomic_numbers (array_like): integer atomic numbers of any shape
+        attribute (str): name of the :py:class:`Element
+            <mendeleev.models.Element>` column
+
+    Returns:
+        array of the same shape as `atomic_numbers`, NULL values are NaN
+
+    Raises:
+        ValueError: when an atomic number or the attribute is not recognized
+
+    Example:
+
+        >>> from mendeleev import gather
+        >>> gather([1, 6, 6, 8], "atomic_weight")
+        array([ 1.008, 12.011, 12.011, 15.999])
+    """
+    return _property_table.take(atomic_numbers, [attribute])[attribute]
+
+
+def gather_many(
+    atomic_numbers: Any, attributes: Iterable[str]
+) -> Dict[str, np.ndarray]:
+    """
+    Map an array of atomic numbers to the values of many element attributes.
+
+    Args:
+        atomic_numbers (array_like): integer atomic numbers of any shape
+        attributes (list): names of the :py:class:`Element
+            <mendeleev.models.Element>` columns
+
+    Returns:
+        dict with an array of the same shape as `atomic_numbers` per attribute,
+        see :py:func:`gather`
+    """
+    return _property_table.take(atomic_numbers, list(attributes))
@@ -3,17 +3,38 @@
 """Module defining the database models for elements and related properties."""
 
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
+from collections.abc import Iterable, Sized
+from functools import lru_cache
+from itertools import islice
 from operator import attrgetter
+import copy
 import enum
 import math
+import threading
 import urllib.parse
 import warnings
 
 import numpy as np
-from pint import UnitRegistry, Quantity
-from sqlalchemy import Column, Boolean, Integer, String, Float, ForeignKey, Text, Enum
-from sqlalchemy.orm import declarative_base, relationship, reconstructor
+from sqlalchemy import (
+    Column,
+    Boolean,
+    Integer,
+    String,
+    Float,
+    ForeignKey,
+    Index,
+    Text,
+    Enum,
+    event,
+)
+from sqlalchemy.orm import (
+    declarative_base,
+    deferred,
+    object_session,
+    relationship,
+    reconstructor,
+)
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property, hybrid_method
 from sqlalchemy.inspection import inspect
@@ -29,10 +50,21 @@ from .electronegativity import (
     sanderson,
     interpolate_property,
 )
-from .db import get_session
-from .econf import ElectronicConfiguration, get_l, ORBITALS
+from .db import cache_token, database_path, get_shared_session
+from .econf import (
+    OCCUPATIONS_SHAPE,
+    ElectronicConfiguration,
+    get_l,
+    ORBITALS,
+    slater_screening_array,
+)
 from .utils import coeffs
 
+if TYPE_CHECKING:
+    from pint import Quantity, UnitRegistry
+
+    from .snapshot import ElementSnapshot
+
 
 __all__ = [
     "Element",
@@ -51,8 +83,41 @@ __all__ = [
 
 
 Base = declarative_base()
-ureg = UnitRegistry()
-ureg.define("USD = [currency]")
+
+# the unit registry and unit metadata are built on first use, see `get_unit_registry`
+# and `get_unit_cache`
+_unit_lock = threading.Lock()
+_unit_registry = None
+_unit_cache = None
+
+
+def get_unit_registry() -> UnitRegistry:
+    """Return the pint unit registry, created on first use."""
+    global _unit_registry
+    if _unit_registry is None:
+        with _unit_lock:
+            if _unit_registry is None:
+                from pint import UnitRegistry
+
+                registry = UnitRegistry()
+                registry.define("USD = [currency]")
+                _unit_registry = registry
+    return _unit_registry
+
+
+# default number of items shown by `repr_collection`
+REPR_COLLECTION_LIMIT = 10
+
+
+@lru_cache(maxsize=None)
+def _repr_metadata(cls: type) -> Tuple[frozenset, str]:
+    """
+    Return the relationship names of a mapped class and their representation,
+    computed once per class.
+    """
+    relations = {m.key: m.mapper.class_.__name__ for m in inspect(cls).relationships}
+    relations_str = ", ".join(f"{key}={value}[...]" for key, value in relations.items())
+    return frozenset(relations), relations_str
 
 
 class ReprMixin:
@@ -66,18 +131,11 @@ class ReprMixin:
         Generate a string representation of the model instance by
         including all its attributes and their values.
         """
-        mapper = inspect(self.__class__)
-        relations = {m.key: m.mapper.class_.__name__ for m in mapper.relationships}
-        attrs = {
-            key: value
-            for key, value in self.__dict__.items()
-            if not key.startswith("_") and key not in relations.keys()
-        }
+        relations, relations_str = _repr_metadata(self.__class__)
         attrs_str = ", ".join(
-            f"{key}={repr(value)}" for key, value in sorted(attrs.items())
-        )
-        relations_str = ", ".join(
-            f"{key}={value}[...]" for key, value in relations.items()
+            f"{key}={value!r}"
+            for key, value in sorted(self.__dict__.items())
+            if not key.startswith("_") and key not in relations
         )
         if relations:
             return f"<{self.__class__.__name__}({attrs_str}, {relations_str})>"
@@ -85,6 +143,29 @@ class ReprMixin:
             return f"<{self.__class__.__name__}({attrs_str})>"
 
 
+def repr_collection(items: Iterable[Any], limit: int = REPR_COLLECTION_LIMIT) -> str:
+    """
+    Return the representation of a collection truncated after `limit` items.
+
+    Args:
+        items: collection of objects, e.g. a relationship of a model
+        limit: maximal number of items included
+
+    Example:
+
+        >>> from mendeleev import element
+        >>> from mendeleev.models import repr_collection
+        >>> print(repr_collection(element("Sn").isotopes, limit=1))  # doctest: +ELLIPSIS
+        [<Isotope(...)>, ... (41 more)]
+    """
+    if not isinstance(items, Sized):
+        items = list(items)
+    shown = [repr(item) for item in islice(items, limit)]
+    if len(items) > limit:
+        shown.append(f"... ({len(items) - limit} more)")
+    return "[" + ", ".join(shown) + "]"
+
+
 class ValueOrigin(enum.Enum):
     "Options for the origin of the property value."
 
@@ -125,21 +206,35 @@ class PropertyMetadata(Base, ReprMixin):
 
 def fetch_unit_metadata() -> dict[tuple, str]:
     """Fetch unit metadata from the database for all dimensional properties."""
-    session = get_session()
+    session = get_shared_session()
     rows = (
         session.query(PropertyMetadata).filter(PropertyMetadata.unit.isnot(None)).all()
     )
-    metadata = {(row.class_name, row.attribute_name): row.unit for row in rows}
-    session.close()
-    return metadata
+    return {(row.class_name, row.attribute_name): row.unit for row in rows}
 
 
-UNIT_CACHE = fetch_unit_metadata()
+def get_unit_cache() -> dict[tuple, str]:
+    """Return the unit metadata, fetched from the database on first use."""
+    global _unit_cache
+    if _unit_cache is None:
+        with _unit_lock:
+            if _unit_cache is None:
+                _unit_cache = fetch_unit_metadata()
+    return _unit_cache
+
+
+def __getattr__(name: str) -> Any:
+    "Lazily provide the `ureg` and `UNIT_CACHE` module attributes"
+    if name == "ureg":
+        return get_unit_registry()
+    if name == "UNIT_CACHE":
+        return get_unit_cache()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 class UnitMixin:
     def get_unit(self, attribute_name: str) -> str:
-        return UNIT_CACHE.get((self.__class__.__name__, attribute_name))
+        return get_unit_cache().get((self.__class__.__name__, attribute_name))
 
     def __getattr__(self, name: str) -> Any:
         if name.endswith("_u"):
@@ -156,7 +251,7 @@ class UnitMixin:
             value = getattr(self, attr_name)
             if value is None:
                 return None
-            return value * ureg(unit)
+            return value * get_unit_registry()(unit)
         raise AttributeError(
             f"'{self.__class__.__name__}' object has no attribute '{name}'"
         )
@@ -268,6 +363,10 @@ class Element(Base, ReprMixin, UnitMixin):
 
     __tablename__ = "elements"
 
+    # long free-text columns (description, discoverers, name_origin, sources,
+    # uses) are deferred and loaded on first access or upfront with the "text"
+    # group, see `mendeleev.element`
+
     abundance_crust = Column(Float)
     abundance_sea = Column(Float)
     atomic_number = Column(Integer, primary_key=True)
@@ -286,10 +385,10 @@ class Element(Base, ReprMixin, UnitMixin):
     c6_gb = Column(Float)
     cpk_color = Column(String)
     density = Column(Float)
-    description = Column(String)
+    description = deferred(Column(String), group="text")
     dipole_polarizability = Column(Float)
     dipole_polarizability_unc = Column(Float)
-    discoverers = Column(String)
+    discoverers = deferred(Column(String), group="text")
     discovery_location = Column(String)
     discovery_year = Column(Integer)
     electron_affinity = Column(Float)
@@ -322,18 +421,18 @@ class Element(Base, ReprMixin, UnitMixin):
     miedema_electron_density = Column(Float)
     molar_heat_capacity = Column(Float)
     molcas_gv_color = Column(String)
-    name = Column(String)
-    name_origin = Column(String)
+    name = Column(String, index=True)
+    name_origin = deferred(Column(String), group="text")
     period = Column(Integer)
     pettifor_number = Column(Integer)
     price_per_kg = Column(Float)
     proton_affinity = Column(Float)
     series = association_proxy("_series", "name")
-    sources = Column(String)
+    sources = deferred(Column(String), group="text")
     specific_heat_capacity = Column(Float)
-    symbol = Column(String)
+    symbol = Column(String, index=True)
     thermal_conductivity = Column(Float)
-    uses = Column(String)
+    uses = deferred(Column(String), group="text")
     vdw_radius = Column(Float)
     vdw_radius_alvarez = Column(Float)
     vdw_radius_bondi = Column(Float)
@@ -356,20 +455,27 @@ class Element(Base, ReprMixin, UnitMixin):
     top_3_reserve_holders = Column(String)
 
     _series_id = Column("series_id", Integer, ForeignKey("series.id"))
-    _ionization_energies = relationship("IonizationEnergy", lazy="subquery")
-    _oxidation_states = relationship("OxidationState", lazy="subquery")
     _series = relationship("Series", uselist=False, lazy="subquery")
 
-    ionic_radii = relationship("IonicRadius", lazy="subquery")
-    isotopes = relationship("Isotope", lazy="subquery", back_populates="element")
-    phase_transitions = relationship("PhaseTransition", lazy="subquery")
-    scattering_factors = relationship("ScatteringFactor", lazy="subquery")
-    screening_constants = relationship("ScreeningConstant", lazy="subquery")
+    # collections are loaded on first access unless requested upfront with the
+    # `load` argument of `element` and `get_all_elements`
+    _ionization_energies = relationship("IonizationEnergy", lazy="select")
+    _oxidation_states = relationship("OxidationState", lazy="select")
+    ionic_radii = relationship("IonicRadius", lazy="select")
+    isotopes = relationship("Isotope", lazy="select", back_populates="element")
+    phase_transitions = relationship("PhaseTransition", lazy="select")
+    scattering_factors = relationship("ScatteringFactor", lazy="select")
+    screening_constants = relationship("ScreeningConstant", lazy="select")
 
     @reconstructor
     def init_on_load(self) -> None:
         "Initialize the ElectronicConfiguration class as attribute of self"
         self.ec = ElectronicConfiguration(self.econf)
+        # path of the database the element was loaded from, see `__eq__`
+        session = object_session(self)
+        self._db_token = (
+            database_path(session.get_bind()) if session is not None else None
+        )
 
     @hybrid_property
     def atomic_volume(self) -> float:
@@ -381,13 +487,32 @@ class Element(Base, ReprMixin, UnitMixin):
         """Alias for `specific_heat_capacity` for backwards compatibility"""
         return self.specific_heat_capacity
 
+    def _derived(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Return a value derived from the relationships cached on the instance.
+
+        The cache is cleared when the ionization energies, oxidation states or
+        screening constants collections are modified or the instance is expired.
+        """
+        cache = self.__dict__.get("_derived_cache")
+        if cache is None:
+            cache = self.__dict__["_derived_cache"] = {}
+        if key not in cache:
+            cache[key] = compute()
+        # the instances are shared by all the callers, see `element`, so the
+        # callers get copies of the cached dicts and lists
+        return copy.copy(cache[key])
+
     @hybrid_property
     def ionenergies(self) -> Dict[int, float]:
         """
         Return a dict with ionization degree as keys and ionization energies
         in eV as values.
         """
-        return {ie.degree: ie.energy for ie in self._ionization_energies}
+        return self._derived(
+            "ionenergies",
+            lambda: {ie.degree: ie.energy for ie in self._ionization_energies},
+        )
 
     @hybrid_property
     def oxistates(self) -> List[int]:
@@ -399,7 +524,10 @@ class Element(Base, ReprMixin, UnitMixin):
         """
         Return a dict with screening constants with tuples (n, s) as keys and
         screening constants as values"""
-        return {(x.n, x.s): x.screening for x in self.screening_constants}
+        return self._derived(
+            "sconst",
+            lambda: {(x.n, x.s): x.screening for x in self.screening_constants},
+        )
 
     @hybrid_property
     def inchi(self) -> str:
@@ -624,14 +752,20 @@ class Element(Base, ReprMixin, UnitMixin):
             )
 
         if category == "all":
-            return sorted([o.oxidation_state for o in self._oxidation_states])
+            return self._derived(
+                ("oxidation_states", category),
+                lambda: sorted([o.oxidation_state for o in self._oxidation_states]),
+            )
         else:
-            return sorted(
-                [
-                    o.oxidation_state
-                    for o in self._oxidation_states
-                    if o.category == category
-                ]
+            return self._derived(
+                ("oxidation_states", category),
+                lambda: sorted(
+                    [
+                        o.oxidation_state
+                        for o in self._oxidation_states
+                        if o.category == category
+                    ]
+                ),
             )
 
     def zeff(
@@ -887,12 +1021,10 @@ class Element(Base, ReprMixin, UnitMixin):
         Args:
             radius : radius to use in the calculation
         """
-        results = fetch_by_group(["atomic_number", radius], group=18)
-        # transpose rows to list of properties
-        atomic_numbers, radii = list(zip(*results))
-        noble_gas_radius = interpolate_property(
-            self.atomic_number, atomic_numbers, radii
-        )
+        atomic_numbers, _, reference = noble_gas_reference(radius)
+        noble_gas_radius = reference[
+            np.searchsorted(atomic_numbers, self.atomic_number)
+        ]
         return sanderson(getattr(self, radius), noble_gas_radius)
 
     def nvalence(self, method: str = None) -> int:
@@ -910,37 +1042,66 @@ class Element(Base, ReprMixin, UnitMixin):
         normal_coeffs = [[str(c) if c != 1 else "" for c in t] for t in oxide_coeffs]
         return [f"{self.symbol}{cme}O{co}" for cme, co in normal_coeffs]
 
-    def __hash__(self) -> int:
-        """Custom has function to allow comparisons
+    def snapshot(self) -> ElementSnapshot:
+        """
+        Return a detached, immutable and picklable copy of the element.
 
-        This drops allt he nested, related objects since SQLAlchemy use a custom
-        unhashable `InstrumentedList`.
+        See :py:mod:`mendeleev.snapshot` for details.
         """
-        to_drop = [
-            "_ionization_energies",
-            "_oxidation_states",
-            "_sa_instance_state",
-            "_series",
-            "_series_id",
-            "ec",
-            "group",
-            "ionic_radii",
-            "isotopes",
-            "screening_constants",
-            "phase_transitions",
-            "scattering_factors",
-        ]
-        hashable = [(k, v) for k, v in self.__dict__.items() if k not in to_drop]
-        return hash(tuple(sorted(hashable)))
+        from .snapshot import ElementSnapshot
+
+        return ElementSnapshot.from_model(self)
+
+    def deep_equals(self, other: Any) -> bool:
+        """
+        Compare the values of all the columns with the `other` element.
+
+        Unlike ``==``, which only compares the atomic numbers and the database
+        the elements were loaded from, this loads and compares the content.
+        """
+        if not isinstance(other, Element):
+            return False
+        return all(
+            getattr(self, attr.key) == getattr(other, attr.key)
+            for attr in inspect(Element).column_attrs
+        )
+
+    def __hash__(self) -> int:
+        """Hash the atomic number and the database the element was loaded from"""
+        return hash((self.atomic_number, self.__dict__.get("_db_token")))
 
     def __eq__(self, other) -> bool:
-        """Overwrite the defalt comparison"""
-        return hash(self) == hash(other)
+        """
+        Elements are equal when they have the same atomic number and were loaded
+        from the same database, see :py:meth:`deep_equals` to compare the values
+        """
+        if not isinstance(other, Element):
+            return NotImplemented
+        return (self.atomic_number, self.__dict__.get("_db_token")) == (
+            other.atomic_number,
+            other.__dict__.get("_db_token"),
+        )
 
     def __str__(self) -> str:
         return "{0} {1} {2}".format(self.atomic_number, self.symbol, self.name)
 
 
+def _clear_derived_cache(target: Element, *args) -> None:
+    "Drop the values cached by `Element._derived`"
+    target.__dict__.pop("_derived_cache", None)
+
+
+for _attribute in (
+    Element._ionization_energies,
+    Element._oxidation_states,
+    Element.screening_constants,
+):
+    for _identifier in ("append", "remove", "bulk_replace"):
+        event.listen(_attribute, _identifier, _clear_derived_cache)
+event.listen(Element, "expire", _clear_derived_cache)
+event.listen(Element, "refresh", _clear_derived_cache)
+
+
 def fetch_by_group(properties: List[str], group: int = 18) -> tuple[list[Any]]:
     """
     Get a specified properties for all the elements of a given group.
@@ -960,15 +1121,152 @@ def fetch_by_group(properties: List[str], group: int = 18) -> tuple[list[Any]]:
     if "atomic_number" not in props:
         props = ["atomic_number"] + props
 
-    session = get_session()
-    results = (
+    session = get_shared_session()
+    return (
         session.query(*[getattr(Element, prop) for prop in props])
         .filter(Element.group_id == group)
         .order_by("atomic_number")
         .all()
     )
-    session.close()
-    return results
+
+
+_noble_gas_lock = threading.Lock()
+_noble_gas_references: Dict[Tuple[Any, str], Tuple[np.ndarray, ...]] = {}
+
+
+def noble_gas_reference(
+    radius: str = "covalent_radius_pyykko",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the reference radii of hypothetical noble gases for all elements.
+
+    The radii of the group 18 elements are interpolated, or extrapolated, to
+    the atomic numbers of all the elements as required by Sanderson's scale.
+    The result is computed once per radius and database state.
+
+    Args:
+        radius: name of the radius attribute of `Element`
+
+    Returns:
+        atomic numbers, radii and noble gas reference radii of all the elements
+        as read-only arrays ordered by atomic number
+    """
+    key = (cache_token(), radius)
+    reference = _noble_gas_references.get(key)
+    if reference is None:
+        with _noble_gas_lock:
+            reference = _noble_gas_references.get(key)
+            if reference is None:
+                reference = _build_noble_gas_reference(radius)
+                # drop the references computed for a previous database state
+                for old in [k for k in _noble_gas_references if k[0] != key[0]]:
+                    del _noble_gas_references[old]
+                _noble_gas_references[key] = reference
+    return reference
+
+
+def _build_noble_gas_reference(radius: str) -> Tuple[np.ndarray, ...]:
+    "Compute the arrays returned by `noble_gas_reference`"
+    noble_gases = np.array(fetch_by_group(["atomic_number", radius]), dtype=float)
+    ng_atomic_numbers, ng_radii = noble_gases.T
+    rows = (
+        get_shared_session()
+        .query(Element.atomic_number, getattr(Element, radius))
+        .order_by(Element.atomic_number)
+        .all()
+    )
+    atomic_numbers, radii = np.array(rows, dtype=float).T
+    reference = interpolate_property(atomic_numbers, ng_atomic_numbers, ng_radii)
+    arrays = (atomic_numbers.astype(int), radii, reference)
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+
+def sanderson_all(radius: str = "covalent_radius_pyykko") -> np.ndarray:
+    """
+    Return Sanderson's electronegativity of all the elements ordered by atomic
+    number, see :py:meth:`Element.electronegativity_sanderson`.
+
+    Args:
+        radius: name of the radius attribute of `Element`
+    """
+    _, radii, reference = noble_gas_reference(radius)
+    return sanderson(radii, reference)
+
+
+_slater_lock = threading.RLock()
+_slater_tables: Dict[Tuple[Any, str], np.ndarray] = {}
+
+
+def _cached_table(name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+    "Return the table built by `build` once per database state"
+    key = (cache_token(), name)
+    table = _slater_tables.get(key)
+    if table is None:
+        with _slater_lock:
+            table = _slater_tables.get(key)
+            if table is None:
+                table = build()
+                table.setflags(write=False)
+                # drop the tables computed for a previous database state
+                for old in [k for k in _slater_tables if k[0] != key[0]]:
+                    del _slater_tables[old]
+                _slater_tables[key] = table
+    return table
+
+
+def _build_occupation_table() -> np.ndarray:
+    "Compute the array returned by `occupation_table`"
+    rows = (
+        get_shared_session()
+        .query(Element.atomic_number, Element.econf)
+        .order_by(Element.atomic_number)
+        .all()
+    )
+    table = np.zeros((rows[-1][0],) + OCCUPATIONS_SHAPE, dtype=int)
+    for atomic_number, econf in rows:
+        table[atomic_number - 1] = ElectronicConfiguration(econf).occupations()
+    return table
+
+
+def occupation_table() -> np.ndarray:
+    """
+    Return the read-only array of ground state subshell occupations of all the
+    elements indexed by ``[atomic_number - 1, n, l]``, see
+    :py:meth:`ElectronicConfiguration.occupations
+    <mendeleev.econf.ElectronicConfiguration.occupations>`.
+    """
+    return _cached_table("occupations", _build_occupation_table)
+
+
+def _build_slater_zeff_table(alle: bool) -> np.ndarray:
+    "Compute the array returned by `slater_zeff_table`"
+    occupations = occupation_table()
+    atomic_numbers = np.arange(1, occupations.shape[0] + 1, dtype=float)
+    zeff = atomic_numbers[:, np.newaxis, np.newaxis] - slater_screening_array(
+        occupations, alle=alle
+    )
+    zeff[occupations[..., : zeff.shape[-1]] == 0] = np.nan
+    return zeff
+
+
+def slater_zeff_table(alle: bool = False) -> np.ndarray:
+    """
+    Return Slater's effective nuclear charges of all the occupied subshells of
+    all the elements, see :py:meth:`Element.zeff`.
+
+    Args:
+        alle: Use all the valence electrons, i.e. calculate screening for an
+            extra electron
+
+    Returns:
+        read-only array indexed by ``[atomic_number - 1, n, l]`` for the `s`,
+        `p`, `d` and `f` subshells, NaN for the unoccupied subshells
+    """
+    return _cached_table(
+        f"slater_zeff_alle={alle}", lambda: _build_slater_zeff_table(alle)
+    )
 
 
 class IonicRadius(Base, ReprMixin, UnitMixin):
@@ -993,6 +1291,9 @@ class IonicRadius(Base, ReprMixin, UnitMixin):
     """
 
     __tablename__ = "ionicradii"
+    __table_args__ = (
+        Index("ix_ionicradii_atomic_number_charge", "atomic_number", "charge"),
+    )
 
     id = Column(Integer, primary_key=True)
     atomic_number = Column(Integer, ForeignKey("elements.atomic_number"))
@@ -1036,6 +1337,13 @@ class IonizationEnergy(Base, ReprMixin, UnitMixin):
     """
 
     __tablename__ = "ionizationenergies"
+    __table_args__ = (
+        Index(
+            "ix_ionizationenergies_atomic_number_ion_charge",
+            "atomic_number",
+            "ion_charge",
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     atomic_number = Column(
@@ -1082,7 +1390,7 @@ class OxidationState(Base, ReprMixin):
     __tablename__ = "oxidationstates"
 
     id = Column(Integer, primary_key=True)
-    atomic_number = Column(Integer, ForeignKey("elements.atomic_number"))
+    atomic_number = Column(Integer, ForeignKey("elements.atomic_number"), index=True)
     oxidation_state = Column(Integer)
     category = Column(String)
 
@@ -1166,6 +1474,9 @@ class Isotope(Base, ReprMixin, UnitMixin):
     """
 
     __tablename__ = "isotopes"
+    __table_args__ = (
+        Index("ix_isotopes_atomic_number_mass_number", "atomic_number", "mass_number"),
+    )
 
     id = Column(Integer, primary_key=True)
     abundance = Column(Float)
@@ -1186,7 +1497,7 @@ class Isotope(Base, ReprMixin, UnitMixin):
     quadrupole_moment_uncertainty = Column(Float)
     spin = Column(String)
 
-    element = relationship("Element", lazy="joined", back_populates="isotopes")
+    element = relationship("Element", lazy="select", back_populates="isotopes")
     decay_modes = relationship("IsotopeDecayMode", lazy="subquery")
 
     @hybrid_property
@@ -1197,7 +1508,7 @@ class Isotope(Base, ReprMixin, UnitMixin):
     @property
     def half_life_u(self) -> "Quantity":
         "Half life time as pint.Quantity with units"
-        return self.half_file * ureg(self.half_life_unit)
+        return self.half_file * get_unit_registry()(self.half_life_unit)
 
     def __str__(self) -> str:
         return "atomic_number={0:5d}, mass_number={1:5d}, mass={2:10s}, abundance={3:10s}".format(
@@ -1225,7 +1536,7 @@ class IsotopeDecayMode(Base, ReprMixin):
     __tablename__ = "isotopedecaymodes"
 
     id = Column(Integer, primary_key=True)
-    isotope_id = Column(ForeignKey("isotopes.id"))
+    isotope_id = Column(ForeignKey("isotopes.id"), index=True)
     mode = Column(String(10), nullable=False)
     relation = Column(String(1))
     intensity = Column(Float, nullable=True)
@@ -1263,7 +1574,7 @@ class ScreeningConstant(Base, ReprMixin):
     __tablename__ = "screeningconstants"
 
     id = Column(Integer, primary_key=True)
-    atomic_number = Column(Integer, ForeignKey("elements.atomic_number"))
+    atomic_number = Column(Integer, ForeignKey("elements.atomic_number"), index=True)
     n = Column(Integer)
     s = Column(String)
     screening = Column(Float)
@@ -1291,7 +1602,7 @@ class PhaseTransition(Base, ReprMixin, UnitMixin):
     __tablename__ = "phasetransitions"
 
     id = Column(Integer, primary_key=True)
-    atomic_number = Column(Integer, ForeignKey("elements.atomic_number"))
+    atomic_number = Column(Integer, ForeignKey("elements.atomic_number"), index=True)
     boiling_point = Column(Float)
     melting_point = Column(Float)
     critical_temperature = Column(Float)
@@ -1373,6 +1684,9 @@ class ScatteringFactor(Base, ReprMixin, UnitMixin):
     """
 
     __tablename__ = "scattering_factors"
+    __table_args__ = (
+        Index("ix_scattering_factors_atomic_number_energy", "atomic_number", "energy"),
+    )
 
     id = Column(Integer, primary_key=True)
     atomic_number = Column(Integer, ForeignKey("elements.atomic_number"))
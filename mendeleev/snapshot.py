@@ -0,0 +1,245 @@
+"""
+Detached, immutable snapshots of the database models.
+
+Snapshots are plain value objects holding a copy of every column, hybrid
+property and relationship collection of a model instance. They are not bound
+to a database session, so they can be shared between threads and pickled to
+other processes, e.g. when fanning out calculations over a
+:py:class:`concurrent.futures.ProcessPoolExecutor`.
+
+Examples:
+
+>>> from mendeleev.snapshot import all_elements
+>>> fe = all_elements()[25]
+>>> fe.symbol, fe.ionenergies[1]
+('Fe', 7.9024681)
+"""
+
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
+import threading
+
+from sqlalchemy.ext.associationproxy import AssociationProxy
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.inspection import inspect
+
+from .db import cache_token
+from .models import (
+    Element,
+    Group,
+    IonicRadius,
+    IonizationEnergy,
+    Isotope,
+    IsotopeDecayMode,
+    OxidationState,
+    PhaseTransition,
+    ScatteringFactor,
+    ScreeningConstant,
+    Series,
+)
+
+
+__all__ = [
+    "Snapshot",
+    "ElementSnapshot",
+    "GroupSnapshot",
+    "IonicRadiusSnapshot",
+    "IonizationEnergySnapshot",
+    "IsotopeSnapshot",
+    "IsotopeDecayModeSnapshot",
+    "OxidationStateSnapshot",
+    "PhaseTransitionSnapshot",
+    "ScatteringFactorSnapshot",
+    "ScreeningConstantSnapshot",
+    "SeriesSnapshot",
+    "snapshot_class",
+    "all_elements",
+]
+
+
+def _freeze(value: Any) -> Any:
+    "Return an immutable view of a container value"
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    "Return a picklable copy of a frozen container value"
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    return value
+
+
+class Snapshot:
+    """
+    Base class of the immutable model snapshots.
+
+    Subclasses are created with :py:func:`snapshot_class` and define the
+    snapshot fields as ``__slots__``.
+    """
+
+    __slots__ = ()
+    # names of all the fields in the order of the constructor arguments
+    _fields: Tuple[str, ...] = ()
+    # names of the fields identifying the snapshot, used for hashing
+    _key: Tuple[str, ...] = ()
+    # model attributes copied into the fields, field name -> attribute name
+    _sources: Dict[str, str] = {}
+    # fields holding related snapshots, field name -> (snapshot class, uselist)
+    _relations: Dict[str, Tuple[type, bool]] = {}
+
+    def __init__(self, *values: Any) -> None:
+        if len(values) != len(self._fields):
+            raise TypeError(
+                f"{type(self).__name__} expects {len(self._fields)} values, "
+                f"got {len(values)}"
+            )
+        for name, value in zip(self._fields, values):
+            object.__setattr__(self, name, _freeze(value))
+
+    @classmethod
+    def from_model(cls, obj: Any) -> Snapshot:
+        "Create a snapshot of the `obj` model instance"
+        values = []
+        for name in cls._fields:
+            attr = cls._sources.get(name, name)
+            if name in cls._relations:
+                snapshot_cls, uselist = cls._relations[name]
+                related = getattr(obj, attr)
+                if uselist:
+                    value = tuple(snapshot_cls.from_model(r) for r in related)
+                else:
+                    value = (
+                        None if related is None else snapshot_cls.from_model(related)
+                    )
+            else:
+                try:
+                    value = getattr(obj, attr)
+                except (TypeError, ValueError, ZeroDivisionError):
+                    # derived values that cannot be computed for missing data
+                    value = None
+            values.append(value)
+        return cls(*values)
+
+    def _asdict(self) -> Dict[str, Any]:
+        "Return the fields as a dictionary"
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), tuple(_thaw(getattr(self, name)) for name in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self._fields)
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__,) + tuple(getattr(self, n) for n in self._key))
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self._fields
+            if name not in self._relations
+        )
+        return f"<{type(self).__name__}({values})>"
+
+
+def snapshot_class(model: type, relations: Dict[str, Tuple[str, type]] = None) -> type:
+    """
+    Create the snapshot class of a model.
+
+    Args:
+        model: the mapped model class
+        relations: related snapshots to include, mapping of the field name to
+            the relationship attribute name and the snapshot class of the
+            related model
+
+    The snapshot holds all the public columns, hybrid properties and
+    association proxies of the model.
+    """
+    relations = relations or {}
+    mapper = inspect(model)
+    columns = [a.key for a in mapper.column_attrs if not a.key.startswith("_")]
+    derived = [
+        key
+        for key, descriptor in mapper.all_orm_descriptors.items()
+        if isinstance(descriptor, (hybrid_property, AssociationProxy))
+        and not key.startswith("_")
+    ]
+    fields = tuple(columns + sorted(derived) + list(relations))
+    namespace = {
+        "__slots__": fields,
+        "__module__": __name__,
+        "__doc__": f"Immutable snapshot of :py:class:`{model.__name__} "
+        f"<{model.__module__}.{model.__name__}>`",
+        "_fields": fields,
+        "_key": tuple(c.key for c in mapper.primary_key),
+        "_sources": {name: attr for name, (attr, _) in relations.items()},
+        "_relations": {
+            name: (cls, mapper.relationships[attr].uselist)
+            for name, (attr, cls) in relations.items()
+        },
+    }
+    return type(f"{model.__name__}Snapshot", (Snapshot,), namespace)
+
+
+GroupSnapshot = snapshot_class(Group)
+IonicRadiusSnapshot = snapshot_class(IonicRadius)
+IonizationEnergySnapshot = snapshot_class(IonizationEnergy)
+IsotopeDecayModeSnapshot = snapshot_class(IsotopeDecayMode)
+IsotopeSnapshot = snapshot_class(
+    Isotope, {"decay_modes": ("decay_modes", IsotopeDecayModeSnapshot)}
+)
+OxidationStateSnapshot = snapshot_class(OxidationState)
+PhaseTransitionSnapshot = snapshot_class(PhaseTransition)
+ScatteringFactorSnapshot = snapshot_class(ScatteringFactor)
+ScreeningConstantSnapshot = snapshot_class(ScreeningConstant)
+SeriesSnapshot = snapshot_class(Series)
+ElementSnapshot = snapshot_class(
+    Element,
+    {
+        "group": ("group", GroupSnapshot),
+        "ionic_radii": ("ionic_radii", IonicRadiusSnapshot),
+        "ionization_energies": ("_ionization_energies", IonizationEnergySnapshot),
+        "isotopes": ("isotopes", IsotopeSnapshot),
+        "oxidation_states": ("_oxidation_states", OxidationStateSnapshot),
+        "phase_transitions": ("phase_transitions", PhaseTransitionSnapshot),
+        "scattering_factors": ("scattering_factors", ScatteringFactorSnapshot),
+        "screening_constants": ("screening_constants", ScreeningConstantSnapshot),
+    },
+)
+
+_lock = threading.Lock()
+_elements: Tuple[ElementSnapshot, ...] = ()
+_token = None
+
+
+def all_elements() -> Tuple[ElementSnapshot, ...]:
+    """
+    Return the snapshots of all the elements ordered by atomic number.
+
+    The snapshots are created once per database state, see
+    :py:func:`mendeleev.db.cache_token`, and shared by all the callers.
+    """
+    global _elements, _token
+    token = cache_token()
+    if token != _token:
+        with _lock:
+            if token != _token:
+                from .mendeleev import get_all_elements
+
+                elements = get_all_elements(load="full")
+                _elements = tuple(ElementSnapshot.from_model(e) for e in elements)
+                _token = token
+    return _elements
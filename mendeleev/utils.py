@@ -2,13 +2,11 @@
 
 # TODO: can be removed after dropping support for python 3.8
 from __future__ import annotations
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 import math
 
-import pandas as pd
-from sqlalchemy.exc import SQLAlchemyError
-
-from mendeleev.db import get_session
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def coeffs(a: int, b: int = 2) -> Tuple[int, int]:
@@ -111,6 +109,10 @@ def update_model_from_df(
         primary_key: Attribute name of model and column name in `data_frame` on which instanced of `model` will be matched with rows from `data_frame`
         dropna: If True, drop rows with NaN values in `attributes` before updating the database
     """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from mendeleev.db import get_session
+
     # check if model has attributes
     if not all(map(lambda attr: hasattr(model, attr), attributes)):
         raise ValueError(f"Model {model} does not have attribute/s.")
@@ -135,12 +135,29 @@ def sqldiff(c, branch="master"):
 
 
 @task
-def timeimport(c):
-    import time
-    import importlib
+def timeimport(c, module="mendeleev.models", repeat=5, budget=1.5):
+    """Measure the import time of a module and check it against a budget.
 
-    start = time.perf_counter()
-    mod = importlib.import_module("mendeleev.models")  # noqa: F841
-    end = time.perf_counter()
+    Each import is timed in a fresh interpreter and the median is compared
+    with the budget in seconds, the task fails if the budget is exceeded.
+    """
+    import statistics
+    import subprocess
+    import sys
+
+    from invoke import Exit
+
+    code = (
+        "import time, importlib; start = time.perf_counter(); "
+        f"importlib.import_module('{module}'); "
+        "print(time.perf_counter() - start)"
+    )
+    timings = [
+        float(subprocess.check_output([sys.executable, "-c", code], text=True))
+        for _ in range(int(repeat))
+    ]
+    median = statistics.median(timings)
 
-    print(f"Import time: {end - start:.6f} seconds")
+    print(f"Import time of {module}: {median:.6f} seconds (median of {repeat})")
+    if median > float(budget):
+        raise Exit(f"Import time exceeds the budget of {float(budget):.3f} seconds")
@@ -1,6 +1,28 @@
-from mendeleev.db import get_engine
-from sqlalchemy import text as sql_text
+from mendeleev.db import (
+    DEFAULT_POOL_OPTIONS,
+    configure_pool,
+    get_engine,
+    get_package_dbpath,
+    get_shared_session,
+    reset,
+    use_in_memory,
+)
+from mendeleev import element
+from mendeleev.models import (
+    Element,
+    IonicRadius,
+    IonizationEnergy,
+    Isotope,
+    IsotopeDecayMode,
+    OxidationState,
+    PhaseTransition,
+    ScatteringFactor,
+    ScreeningConstant,
+)
+from sqlalchemy import select, text as sql_text
+from sqlalchemy.dialects import sqlite
 import pandas as pd
+import pytest
 
 
 def test_read_sql_table():
@@ -18,3 +40,72 @@ def test_read_sql_table_old():
     conn = engine.connect()
     df = pd.read_sql_query(sql=query, con=conn)
     assert df is not None
+
+
+def test_engine_is_reused():
+    assert get_engine() is get_engine()
+    assert get_engine() is get_engine(dbpath=get_package_dbpath())
+    assert get_engine() is not get_engine(read_only=False)
+
+
+def test_shared_session_is_reused():
+    assert get_shared_session() is get_shared_session()
+
+
+def test_reset_disposes_engines():
+    engine = get_engine()
+    session = get_shared_session()
+    reset()
+    assert get_engine() is not engine
+    assert get_shared_session() is not session
+
+
+def test_configure_pool():
+    configure_pool(pool_size=2, max_overflow=0)
+    try:
+        assert get_engine().pool.size() == 2
+    finally:
+        configure_pool()
+    assert get_engine().pool.size() == DEFAULT_POOL_OPTIONS["pool_size"]
+
+
+def test_in_memory_mode():
+    use_in_memory()
+    try:
+        engine = get_engine()
+        assert engine.url.database is None
+        with engine.connect() as conn:
+            nrows = conn.execute(sql_text("select count(*) from elements")).scalar()
+        assert nrows == 118
+        assert element("Fe").name == "Iron"
+    finally:
+        use_in_memory(False)
+    assert get_engine().url.database is not None
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        select(Element).where(Element.symbol == "Fe"),
+        select(Element).where(Element.name == "Iron"),
+        select(Isotope).where(Isotope.atomic_number == 26, Isotope.mass_number == 56),
+        select(Isotope).where(Isotope.atomic_number.in_([1, 26])),
+        select(IsotopeDecayMode).where(IsotopeDecayMode.isotope_id.in_([1, 2])),
+        select(IonizationEnergy).where(IonizationEnergy.atomic_number.in_([1, 26])),
+        select(IonicRadius).where(IonicRadius.atomic_number.in_([1, 26])),
+        select(OxidationState).where(OxidationState.atomic_number.in_([1, 26])),
+        select(PhaseTransition).where(PhaseTransition.atomic_number.in_([1, 26])),
+        select(ScatteringFactor).where(ScatteringFactor.atomic_number.in_([1, 26])),
+        select(ScreeningConstant).where(ScreeningConstant.atomic_number.in_([1, 26])),
+    ],
+)
+def test_query_uses_index(statement):
+    compiled = statement.compile(
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    with get_engine().connect() as conn:
+        plan = conn.execute(sql_text(f"EXPLAIN QUERY PLAN {compiled}")).fetchall()
+    details = [row[-1] for row in plan]
+    assert all(
+        d.startswith("SEARCH") and ("INDEX" in d or "PRIMARY KEY" in d) for d in details
+    ), details
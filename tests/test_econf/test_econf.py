@@ -1,4 +1,13 @@
-from mendeleev.econf import ElectronicConfiguration
+import numpy as np
+import pytest
+
+from mendeleev.econf import (
+    OCCUPATIONS_SHAPE,
+    ElectronicConfiguration,
+    get_l,
+    slater_screening_array,
+    valence_subshells,
+)
 from mendeleev import element
 
 
@@ -38,3 +47,55 @@ def test_nvalence():
 
     th = element("Th")
     assert th.nvalence() == 4
+
+
+def test_parse_cached_configurations_are_independent():
+    ec1 = ElectronicConfiguration("[Ar] 3d6 4s2")
+    ec2 = ElectronicConfiguration("[Ar] 3d6 4s2")
+    ec1.conf[(3, "d")] = 5
+    assert ec2.conf[(3, "d")] == 6
+    assert str(ec2) == "1s2 2s2 2p6 3s2 3p6 3d6 4s2"
+
+
+def test_parse_custom_shellre():
+    ec = ElectronicConfiguration(
+        "[He] 2s2 2p", shellre=r"(?P<n>\d)(?P<o>[sp])(?P<e>\d+)?"
+    )
+    assert str(ec) == "1s2 2s2 2p1"
+
+
+def test_ionize():
+    ec = ElectronicConfiguration("[Ar] 3d6 4s2")
+    ion = ec.ionize(3)
+    assert str(ion) == "1s2 2s2 2p6 3s2 3p6 3d5"
+    assert str(ec) == "1s2 2s2 2p6 3s2 3p6 3d6 4s2"
+    assert str(ion) == str(ElectronicConfiguration(str(ec)).ionize(3))
+
+
+def test_occupations():
+    occ = ElectronicConfiguration("[Ar] 3d6 4s2").occupations()
+    assert occ.shape == OCCUPATIONS_SHAPE
+    assert occ[3, 2] == 6
+    assert occ[4, 0] == 2
+    assert occ.sum() == 26
+
+
+@pytest.mark.parametrize("alle", [False, True])
+def test_slater_screening_array(alle):
+    confs = ["1s2", "[Ne] 3s2 3p3", "[Ar] 3d6 4s2", "[Xe] 4f14 5d10 6s2 6p2"]
+    ecs = [ElectronicConfiguration(conf) for conf in confs]
+    screening = slater_screening_array(np.stack([ec.occupations() for ec in ecs]), alle)
+    for ec, values in zip(ecs, screening):
+        for n in range(1, ec.max_n() + 1):
+            for o in "spdf":
+                assert values[n, get_l(o)] == pytest.approx(
+                    ec.slater_screening(n=n, o=o, alle=alle)
+                )
+
+
+def test_valence_subshells():
+    confs = ["1s2", "[Ne] 3s2 3p3", "[Ar] 3d6 4s2", "[Xe] 4f14 5d10 6s2 6p2"]
+    occupations = np.stack([ElectronicConfiguration(c).occupations() for c in confs])
+    ns, ls = valence_subshells(occupations)
+    assert ns.tolist() == [1, 3, 4, 6]
+    assert ls.tolist() == [0, 1, 0, 1]
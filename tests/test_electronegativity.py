@@ -1,7 +1,10 @@
+import numpy as np
 import pytest
 
-from mendeleev.models import Element
+from mendeleev import get_all_elements
+from mendeleev.models import Element, noble_gas_reference, sanderson_all
 from mendeleev.electronegativity import (
+    _extrapolation_fit,
     allred_rochow,
     cottrell_sutton,
     generic,
@@ -36,6 +39,12 @@ def test_n_effective():
         n_effective(2, "invalid")
 
 
+def test_n_effective_array():
+    values = n_effective(np.array([1, 3, 9]), "zhang")
+    assert values[:2] == pytest.approx([n_effective(1, "zhang"), 2.89])
+    assert np.isnan(values[2])
+
+
 def test_allred_rochow():
     assert allred_rochow(4.0, 1.0) == pytest.approx(4.0)
     assert allred_rochow(9.0, 3.0) == pytest.approx(1.0)
@@ -57,6 +66,14 @@ def test_li_xue():
     )
 
 
+def test_li_xue_array():
+    ie = np.array([13.6, 5.4])
+    radius = np.array([1.0, 90.0])
+    pqn = np.array([1, 2])
+    expected = [li_xue(*args) for args in zip(ie, radius, pqn)]
+    assert li_xue(ie, radius, pqn) == pytest.approx(expected)
+
+
 def test_martynov_batsanov():
     assert martynov_batsanov([13.6, 24.6]) == pytest.approx(4.370354676682432)
     assert martynov_batsanov([10.0, 20.0, 30.0]) == pytest.approx(4.47213595499958)
@@ -109,9 +126,57 @@ def test_linear_interpolation():
     assert pytest.approx(result, 0.0001) == 40.0
 
 
+def test_interpolation_array():
+    x_ref = [2, 3, 4, 5]
+    y_ref = [20, 30, 40, 50]
+    x = np.array([1, 2.5, 4, 7])
+    result = interpolate_property(x, x_ref, y_ref)
+    assert isinstance(result, np.ndarray)
+    assert result == pytest.approx(
+        [interpolate_property(value, x_ref, y_ref) for value in x]
+    )
+    assert result == pytest.approx([10.0, 25.0, 40.0, 70.0])
+
+
+def test_interpolation_scalar_returns_float():
+    assert isinstance(interpolate_property(3, [1, 2, 4, 5], [10, 20, 40, 50]), float)
+    assert isinstance(interpolate_property(0, [1, 2, 4, 5], [10, 20, 40, 50]), float)
+
+
+def test_extrapolation_fit_cached():
+    _extrapolation_fit.cache_clear()
+    x_ref = [11, 12, 13, 14]
+    y_ref = [1, 3, 5, 7]
+    for x in (15, 16, 17, 9):
+        interpolate_property(x, x_ref, y_ref)
+    info = _extrapolation_fit.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+
+
 def test_invalid_inputs():
     x_ref = [1, 2, 3]
     y_ref = [10, 20]  # Mismatched lengths
     x = 2
     with pytest.raises(ValueError):
         interpolate_property(x, x_ref, y_ref)
+
+
+@pytest.mark.parametrize("radius", ["covalent_radius_pyykko", "vdw_radius"])
+def test_sanderson_all(radius):
+    values = sanderson_all(radius)
+    assert values.shape == (118,)
+    for e in get_all_elements()[::7]:
+        if getattr(e, radius) is None:
+            assert np.isnan(values[e.atomic_number - 1])
+            continue
+        expected = e.electronegativity_sanderson(radius=radius)
+        assert values[e.atomic_number - 1] == pytest.approx(expected, nan_ok=True)
+
+
+def test_noble_gas_reference_cached():
+    reference = noble_gas_reference("covalent_radius_pyykko")
+    assert noble_gas_reference("covalent_radius_pyykko") is reference
+    atomic_numbers, radii, noble_gas_radii = reference
+    # the reference matches the noble gases
+    assert noble_gas_radii[17] == pytest.approx(radii[17])
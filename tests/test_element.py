@@ -1,8 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import json
 import math
+import shutil
+import pickle
+import numpy as np
 import pytest
-from mendeleev import element, get_all_elements, get_attribute_for_all_elements
-from mendeleev.db import get_session
-from mendeleev.models import Element
+from sqlalchemy import inspect
+from mendeleev import (
+    element,
+    gather,
+    gather_many,
+    get_all_elements,
+    get_attribute_for_all_elements,
+    get_attributes_for_all_elements,
+    resolve,
+    resolve_many,
+)
+from mendeleev.db import get_package_dbpath, get_session, get_shared_session, reset
+from mendeleev.models import Element, OxidationState, slater_zeff_table
 
 
 SYMBOLS = get_attribute_for_all_elements("symbol")
@@ -15,6 +31,13 @@ def session():
     return get_session()
 
 
+@pytest.fixture
+def unloaded_session():
+    "Reset the shared session and expire the instances moved to the new one"
+    reset()
+    get_shared_session().expire_all()
+
+
 def test_query(session):
     si = session.query(Element).filter(Element.symbol == "Si").one()
     assert si.name == "Silicon"
@@ -26,8 +49,8 @@ def test_element():
 
 
 def test_incorrect_element():
-    with pytest.raises(ValueError, match="Element not found: si"):
-        element("si")
+    with pytest.raises(ValueError, match="Element not found: Xx"):
+        element("Xx")
 
 
 @pytest.mark.parametrize("atomic_number", list(range(1, 119)))
@@ -101,6 +124,41 @@ def test__ne__():
         assert e1 != e2
 
 
+def test_hash_and_eq_across_sessions(session):
+    fe = element("Fe")
+    other = session.query(Element).filter(Element.atomic_number == 26).one()
+    assert other is not fe
+    assert other == fe
+    assert hash(other) == hash(fe)
+    assert len({fe, other, element("Ni")}) == 2
+    assert fe != "Fe"
+    session.close()
+
+
+def test_hash_and_eq_other_database(tmp_path):
+    dbpath = tmp_path / "other.db"
+    shutil.copyfile(get_package_dbpath(), dbpath)
+    session = get_session(dbpath=str(dbpath))
+    other = session.query(Element).filter(Element.atomic_number == 26).one()
+    fe = element("Fe")
+    assert other != fe
+    assert len({fe, other}) == 2
+    assert other == session.query(Element).filter(Element.symbol == "Fe").one()
+    assert fe.deep_equals(other)
+    session.close()
+
+
+def test_deep_equals(session):
+    fe = element("Fe")
+    other = session.query(Element).filter(Element.atomic_number == 26).one()
+    assert fe.deep_equals(other)
+    other.density = 0.0
+    assert other == fe
+    assert not fe.deep_equals(other)
+    assert not fe.deep_equals(element("Ni"))
+    session.close()
+
+
 @pytest.mark.parametrize("element_obj", ELEMENTS)
 def test_melting_points_float_or_none(element_obj):
     assert isinstance(element_obj.melting_point, (float, type(None)))
@@ -135,3 +193,295 @@ def test_electrons(element_obj):
 @pytest.mark.parametrize("element_obj", ELEMENTS)
 def test_price_per_kg_float_or_none(element_obj):
     assert isinstance(element_obj.price_per_kg, (float, type(None)))
+
+
+def test_element_cache_identity():
+    fe = element("Fe")
+    assert element(26) is fe
+    assert element("Iron") is fe
+
+
+def test_element_cache_info():
+    element.cache_clear()
+    element("Fe")
+    element(26)
+    info = element.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.currsize == 1
+    element.cache_clear()
+    assert element.cache_info().currsize == 0
+
+
+def test_element_cache_invalidated_on_reset():
+    fe = element("Fe")
+    misses = element.cache_info().misses
+    reset()
+    assert element("Fe") is fe
+    assert element.cache_info().misses == misses + 1
+    assert inspect(fe).session is get_shared_session()
+
+
+def test_element_usable_after_reset():
+    fe = element("Fe")
+    get_shared_session().expire(fe)
+    assert {"description", "scattering_factors"} <= inspect(fe).unloaded
+    reset()
+    assert fe.description.startswith("Silvery")
+    assert len(fe.scattering_factors) > 0
+    assert fe.isotopes[0].element is fe
+
+
+def test_symbol_attribute_after_reset():
+    import mendeleev
+
+    fe = mendeleev.Fe
+    assert "Fe" not in vars(mendeleev)
+    assert mendeleev.Fe is element("Fe")
+    reset()
+    assert mendeleev.Fe.uses == fe.uses
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other, session = executor.submit(
+            lambda: (mendeleev.Fe, get_shared_session())
+        ).result()
+    assert other is not fe
+    assert inspect(other).session is session
+
+
+def test_element_list_order_and_duplicates():
+    elems = element(["Fe", 1, "Carbon", "Fe", 26, "H"])
+    assert [e.symbol for e in elems] == ["Fe", "H", "C", "Fe", "Fe", "H"]
+    assert elems[0] is elems[3] is elems[4]
+
+
+def test_element_list_missing():
+    with pytest.raises(ValueError, match="Element not found: Xx, Unobtainium, 200"):
+        element(["Si", "Xx", "Unobtainium", 200, "Xx"])
+
+
+def test_load_minimal_loads_relationships_on_access(unloaded_session):
+    h = element("H", load="minimal")
+    assert {"isotopes", "scattering_factors"} <= inspect(h).unloaded
+    assert len(h.isotopes) > 0
+    assert len(h.scattering_factors) > 0
+
+
+def test_load_default_skips_scattering_factors(unloaded_session):
+    unloaded = inspect(element("H")).unloaded
+    assert "isotopes" not in unloaded
+    assert "scattering_factors" in unloaded
+
+
+def test_load_explicit_relationships(unloaded_session):
+    unloaded = inspect(element("H", load=["scattering_factors"])).unloaded
+    assert "scattering_factors" not in unloaded
+    assert "isotopes" in unloaded
+
+
+@pytest.mark.parametrize("load", ["everything", ["isotopes", "unknown"]])
+def test_load_invalid(load):
+    with pytest.raises(ValueError):
+        element("H", load=load)
+
+
+def test_text_columns_deferred(unloaded_session):
+    unloaded = inspect(element("H")).unloaded
+    assert {"description", "sources", "uses"} <= unloaded
+    assert element("H").description is not None
+
+
+def test_text_columns_undeferred(unloaded_session):
+    unloaded = inspect(element("H", load=["text"])).unloaded
+    assert not {"description", "sources", "uses"} & unloaded
+
+
+def test_load_on_cache_hit(unloaded_session):
+    h = element("H", load="minimal")
+    unloaded = inspect(h).unloaded
+    assert {"description", "isotopes", "scattering_factors"} <= unloaded
+    assert element("H", load=["text", "scattering_factors"]) is h
+    unloaded = inspect(h).unloaded
+    assert not {"description", "scattering_factors"} & unloaded
+    assert "isotopes" in unloaded
+
+    (he,) = element(["He"], load="minimal")
+    element(["H", "He"], load=["isotopes"])
+    assert "isotopes" not in inspect(he).unloaded
+
+
+def test_element_cache_per_thread():
+    fe = element("Fe")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(element, "Fe").result()
+        session = executor.submit(get_shared_session).result()
+    assert other is not fe
+    assert inspect(other).session is session
+    assert inspect(fe).session is get_shared_session()
+    assert element("Fe") is fe
+
+
+def test_get_attributes_for_all_elements_numpy():
+    data = get_attributes_for_all_elements(
+        ["atomic_weight", "period", "en_pauling", "symbol"]
+    )
+    assert list(data) == ["atomic_weight", "period", "en_pauling", "symbol"]
+    assert all(len(values) == 118 for values in data.values())
+    assert data["atomic_weight"].dtype == np.float64
+    assert data["period"].dtype.kind == "i"
+    assert data["symbol"].tolist() == SYMBOLS
+    # missing values are NaN
+    assert math.isnan(data["en_pauling"][1])
+    assert data["en_pauling"][0] == pytest.approx(2.2)
+
+
+def test_get_attributes_for_all_elements_dict():
+    data = get_attributes_for_all_elements(["symbol", "en_pauling"], as_="dict")
+    assert data["symbol"] == get_attribute_for_all_elements("symbol")
+    assert data["en_pauling"] == get_attribute_for_all_elements("en_pauling")
+
+
+def test_get_attributes_for_all_elements_pandas():
+    df = get_attributes_for_all_elements(["symbol", "period"], as_="pandas")
+    assert df.index.name == "atomic_number"
+    assert df.loc[26, "symbol"] == "Fe"
+    assert df.shape == (118, 2)
+
+
+def test_get_attributes_for_all_elements_errors():
+    with pytest.raises(ValueError, match="Unknown element attributes: spam"):
+        get_attributes_for_all_elements(["symbol", "spam"])
+    with pytest.raises(ValueError, match="Unknown output format"):
+        get_attributes_for_all_elements(["symbol"], as_="list")
+
+
+def test_gather():
+    z = np.array([[1, 6], [8, 26]])
+    weights = gather(z, "atomic_weight")
+    assert weights.shape == (2, 2)
+    assert weights[1, 1] == pytest.approx(element("Fe").atomic_weight)
+    assert gather([2], "en_pauling")[0] != gather([2], "en_pauling")[0]
+    assert gather(np.array([], dtype=int), "period").shape == (0,)
+
+
+def test_gather_many():
+    z = np.arange(1, 119).repeat(3)
+    data = gather_many(z, ["vdw_radius", "symbol"])
+    assert data["vdw_radius"].shape == (354,)
+    assert data["symbol"][-1] == "Og"
+
+
+@pytest.mark.parametrize("z", [[0], [119], [-1], [1, 1000]])
+def test_gather_unknown_atomic_number(z):
+    with pytest.raises(ValueError, match="Unknown atomic numbers"):
+        gather(z, "vdw_radius")
+
+
+def test_gather_non_integer():
+    with pytest.raises(ValueError, match="Expected integer atomic numbers"):
+        gather([1.0, 2.0], "vdw_radius")
+
+
+@pytest.mark.parametrize(
+    "ids, atomic_number",
+    [
+        ("si", 14),
+        ("SILICON", 14),
+        ("Aluminium", 13),
+        ("caesium", 55),
+        ("Sulphur", 16),
+        ("Tin", 50),
+        (np.int64(26), 26),
+    ],
+)
+def test_resolve(ids, atomic_number):
+    assert resolve(ids) == atomic_number
+    assert element(ids).atomic_number == atomic_number
+
+
+def test_resolve_many():
+    assert resolve_many(iter(["H", "carbon", 8, "Sulphur"])) == [1, 6, 8, 16]
+    with pytest.raises(ValueError, match="Element not found: Xx, 0"):
+        resolve_many(["Xx", 1, 0, "Xx"])
+
+
+def test_derived_values_cached():
+    fe = element("Fe")
+    assert fe.ionenergies == fe.ionenergies
+    assert fe.ionenergies is not fe.ionenergies
+    cache = fe.__dict__["_derived_cache"]
+    assert cache["ionenergies"] == fe.ionenergies
+    assert fe.sconst == fe.sconst
+    assert fe.oxidation_states() == fe.oxistates
+    assert fe.oxidation_states("all") == fe.oxidation_states("all")
+
+
+def test_derived_values_copied(session):
+    fe = session.query(Element).filter(Element.atomic_number == 26).one()
+    assert isinstance(fe.ionenergies, dict)
+    ionenergies, sconst = fe.ionenergies, fe.sconst
+    fe.ionenergies[1] = 0.0
+    fe.sconst[(1, "s")] = 0.0
+    assert fe.ionenergies == ionenergies
+    assert fe.sconst == sconst
+    expected = fe.oxidation_states("all")
+    states = fe.oxidation_states("all")
+    states.remove(states[0])
+    assert fe.oxidation_states("all") == expected
+    assert fe.hardness() == pytest.approx(
+        (fe.ionenergies[1] - fe.electron_affinity) / 2
+    )
+    session.close()
+
+
+def test_pickle_with_derived_values(session):
+    fe = session.query(Element).filter(Element.atomic_number == 26).one()
+    fe.hardness()
+    fe.sconst
+    fe.oxistates
+    json.dumps(fe.ionenergies)
+    for other in (pickle.loads(pickle.dumps(fe)), copy.deepcopy(fe)):
+        assert other.ionenergies == fe.ionenergies
+        assert other.hardness() == pytest.approx(fe.hardness())
+    session.close()
+
+
+def test_derived_values_invalidated(session):
+    fe = session.query(Element).filter(Element.atomic_number == 26).one()
+    states = fe.oxidation_states("all")
+    energies = fe.ionenergies
+    fe._oxidation_states.append(OxidationState(oxidation_state=9, category="main"))
+    assert fe.oxidation_states("all") == sorted(states + [9])
+    assert 9 in fe.oxistates
+    fe._oxidation_states.pop()
+    assert fe.oxidation_states("all") == states
+    fe._ionization_energies = fe._ionization_energies[:1]
+    assert fe.ionenergies == {1: energies[1]}
+    session.expire(fe)
+    assert fe.ionenergies == energies
+    session.close()
+
+
+@pytest.mark.parametrize("alle", [False, True])
+def test_slater_zeff_table(alle):
+    table = slater_zeff_table(alle=alle)
+    assert table.shape == (118, 10, 4)
+    assert not table.flags.writeable
+    for e in get_all_elements()[::5]:
+        for (n, o), _ in e.ec.conf.items():
+            expected = e.atomic_number - e.ec.slater_screening(n=n, o=o, alle=alle)
+            assert table[e.atomic_number - 1, n, "spdf".index(o)] == pytest.approx(
+                expected
+            )
+    # unoccupied subshells
+    assert np.isnan(table[0, 2, 0])
+
+
+def test_zeff_slater_modified_configuration(session):
+    fe = session.query(Element).filter(Element.atomic_number == 26).one()
+    assert fe.zeff() == pytest.approx(3.75)
+    fe.ec = fe.ec.ionize(3)
+    assert fe.zeff() == pytest.approx(6.6)
+    ni = session.query(Element).filter(Element.atomic_number == 28).one()
+    ni.ec.conf[(4, "s")] = 1
+    assert ni.zeff() == pytest.approx(4.4)
+    session.close()
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from mendeleev import element
+from mendeleev.electronegativity import generic
+from mendeleev.en_fit import (
+    evaluate,
+    fit_linear,
+    fit_power_law,
+    grid_search,
+    scale_data,
+)
+
+
+@pytest.fixture(scope="module")
+def data():
+    return scale_data(radius="covalent_radius_pyykko", reference="en_pauling")
+
+
+def test_scale_data(data):
+    assert data.atomic_number.shape == (118,)
+    fe = element("Fe")
+    assert data.zeff[25] == pytest.approx(fe.zeff())
+    assert data.radius[25] == pytest.approx(fe.covalent_radius_pyykko)
+    assert data.reference[25] == pytest.approx(fe.en_pauling)
+    assert np.isnan(data.reference[1])
+
+
+def test_scale_data_unknown_attribute():
+    with pytest.raises(ValueError):
+        scale_data(radius="radius")
+
+
+def test_evaluate_matches_generic(data):
+    values = evaluate(data.zeff, data.radius, 1.5, 0.5)
+    assert values.shape == (118,)
+    assert values == pytest.approx(generic(data.zeff, data.radius, 1.5, 0.5))
+
+
+def test_evaluate_broadcasts_parameters(data):
+    values = evaluate(data.zeff, data.radius, [[1.0], [2.0]], [0.5, 1.0, 1.5])
+    assert values.shape == (2, 3, 118)
+    assert values[1, 2] == pytest.approx(generic(data.zeff, data.radius, 2.0, 1.5))
+
+
+def test_fit_linear():
+    x = np.array([1.0, 2.0, np.nan, 4.0])
+    fit = fit_linear(x, 3.0 * x + 1.0)
+    assert fit.slope == pytest.approx(3.0)
+    assert fit.intercept == pytest.approx(1.0)
+    assert fit.rmse == pytest.approx(0.0, abs=1e-12)
+    assert fit.r2 == pytest.approx(1.0)
+
+
+def test_fit_linear_stacked():
+    x = np.array([[1.0, 2.0, 3.0], [1.0, 4.0, 9.0]])
+    reference = np.array([2.0, 3.0, 5.0])
+    fit = fit_linear(x, reference)
+    for row, slope, intercept in zip(x, fit.slope, fit.intercept):
+        assert [slope, intercept] == pytest.approx(np.polyfit(row, reference, 1))
+
+
+def test_fit_power_law_recovers_parameters(data):
+    mask = np.isfinite(data.radius)
+    reference = 2.0 * generic(data.zeff, data.radius, 1.2, 0.7)
+    fit = fit_power_law(data.zeff[mask], data.radius[mask], reference[mask])
+    assert fit.rpow == pytest.approx(1.2)
+    assert fit.apow == pytest.approx(0.7)
+    assert fit.prefactor == pytest.approx(2.0)
+    assert fit.rmse == pytest.approx(0.0, abs=1e-10)
+
+
+def test_grid_search(data):
+    rpow = [0.5, 1.0, 2.0]
+    apow = [0.5, 1.0]
+    df = grid_search(data, rpow=rpow, apow=apow)
+    assert df.shape == (6, 6)
+    assert df.columns.tolist() == ["rpow", "apow", "slope", "intercept", "rmse", "r2"]
+
+    row = df[(df["rpow"] == 2.0) & (df["apow"] == 0.5)].iloc[0]
+    fit = fit_linear(generic(data.zeff, data.radius, 2.0, 0.5), data.reference)
+    assert row["slope"] == pytest.approx(fit.slope)
+    assert row["rmse"] == pytest.approx(fit.rmse)
@@ -1,9 +1,12 @@
 import pytest
+import numpy as np
 import pandas as pd
+from mendeleev import get_all_elements
 from mendeleev.fetch import (
     fetch_electronegativities,
     fetch_ionic_radii,
     fetch_ionization_energies,
+    fetch_li_xue,
     fetch_neutral_data,
     fetch_table,
 )
@@ -31,6 +34,10 @@ def test_fetch_table(table, nrows):
 def test_fetch_neutral_data():
     df = fetch_neutral_data()
     assert isinstance(df, pd.DataFrame)
+    zeff = {e.atomic_number: e.zeff(method="slater") for e in get_all_elements()}
+    assert df["zeff_slater"].tolist() == pytest.approx(
+        [zeff[z] for z in df["atomic_number"]]
+    )
 
 
 @pytest.mark.parametrize("radius", ("ionic_radius", "crystal_radius"))
@@ -52,3 +59,96 @@ def test_fetch_ionization_energies(degree, cols):
 def test_fetch_electronegativities():
     df = fetch_electronegativities()
     assert isinstance(df, pd.DataFrame)
+
+
+def test_fetch_ionization_energies_long():
+    df = fetch_ionization_energies([1, 2, 3], long=True)
+    assert list(df.columns) == ["atomic_number", "degree", "ionization_energy"]
+    assert set(df["degree"]) == {1, 2, 3}
+    assert isinstance(df.index, pd.RangeIndex)
+    assert df[["atomic_number", "degree"]].equals(
+        df[["atomic_number", "degree"]].sort_values(["atomic_number", "degree"])
+    )
+    # hydrogen has a single electron
+    assert df.loc[df["atomic_number"] == 1, "degree"].tolist() == [1]
+    wide = df.pivot(index="atomic_number", columns="degree", values="ionization_energy")
+    expected = fetch_ionization_energies([1, 2, 3]).loc[wide.index]
+    assert np.allclose(wide.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+
+def test_fetch_ionization_energies_include():
+    df = fetch_ionization_energies(
+        [1, 2], include=["uncertainty", "is_theoretical", "is_semi_empirical"]
+    )
+    assert list(df.columns) == [
+        "IE1",
+        "IE1_uncertainty",
+        "IE1_is_theoretical",
+        "IE1_is_semi_empirical",
+        "IE2",
+        "IE2_uncertainty",
+        "IE2_is_theoretical",
+        "IE2_is_semi_empirical",
+    ]
+    assert df.shape[0] == 118
+    pd.testing.assert_frame_equal(
+        df.loc[:, ["IE1", "IE2"]], fetch_ionization_energies([1, 2])
+    )
+
+
+def test_fetch_ionization_energies_include_unknown():
+    with pytest.raises(ValueError, match="columns not found: references"):
+        fetch_ionization_energies(1, include=["references"])
+
+
+def test_fetch_electronegativities_matches_elements():
+    df = fetch_electronegativities()
+    scales = {
+        "Allred-Rochow": "allred-rochow",
+        "Cottrell-Sutton": "cottrell-sutton",
+        "Gordy": "gordy",
+        "Martynov-Batsanov": "martynov-batsanov",
+        "Mulliken": "mulliken",
+        "Nagle": "nagle",
+        "Sanderson": "sanderson",
+    }
+    for e in get_all_elements():
+        row = df.loc[e.atomic_number]
+        assert row["zeff"] == pytest.approx(e.zeff())
+        for column, scale in scales.items():
+            expected = e.electronegativity(scale=scale)
+            if expected is None:
+                assert np.isnan(row[column]), (e.symbol, column)
+            else:
+                assert row[column] == pytest.approx(expected, nan_ok=True), (
+                    e.symbol,
+                    column,
+                )
+        li_xue = e.electronegativity(scale="li-xue")
+        assert row["Li-Xue"].keys() == li_xue.keys()
+        for key, value in li_xue.items():
+            assert row["Li-Xue"][key] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("radius", ("ionic_radius", "crystal_radius"))
+def test_fetch_li_xue(radius):
+    df = fetch_li_xue(radius)
+    assert df.shape == (507, 3)
+    assert df.index.names == ["atomic_number", "charge", "coordination", "spin"]
+    assert df.columns.tolist() == [radius, "ionization_energy", "Li-Xue"]
+
+    for e in get_all_elements():
+        for charge in {ir.charge for ir in e.ionic_radii if ir.charge > 0}:
+            if charge not in e.ionenergies:
+                continue
+            values = e.electronegativity_li_xue(charge=charge, radius=radius)
+            for (coordination, spin), value in values.items():
+                key = (e.atomic_number, charge, coordination)
+                rows = df.loc[key]
+                row = rows.loc[rows.index.isna()] if spin is None else rows.loc[[spin]]
+                assert row["Li-Xue"].item() == pytest.approx(value), (key, spin)
+
+
+def test_fetch_li_xue_invalid_radius():
+    with pytest.raises(ValueError):
+        fetch_li_xue("atomic_radius")
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 
@@ -44,3 +47,56 @@ def test_element_import():
     from mendeleev import C
 
     assert C is not None
+
+
+def test_models_import_is_lazy():
+    """Test that importing the models neither queries the database nor loads pint"""
+    code = "\n".join(
+        [
+            "import sys",
+            "import mendeleev.models as m",
+            "assert m._unit_cache is None",
+            "assert m._unit_registry is None",
+            "assert 'pint' not in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package does not load the heavy dependencies"""
+    code = "\n".join(
+        [
+            "import sys",
+            "import mendeleev",
+            "heavy = {'numpy', 'pandas', 'pint', 'sqlalchemy'}",
+            "assert not heavy & set(sys.modules), heavy & set(sys.modules)",
+            "assert mendeleev.element('Fe').symbol == 'Fe'",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes():
+    """Test that the lazily imported functions are listed and resolved"""
+    import mendeleev
+
+    for name in ("element", "isotope", "get_all_elements", "fetch", "Fe"):
+        assert name in dir(mendeleev)
+    assert mendeleev.element is mendeleev.mendeleev.element
+    with pytest.raises(AttributeError):
+        mendeleev.os
+
+
+def test_star_import():
+    """Test that the star import exports the public functions"""
+    code = "\n".join(
+        [
+            "from mendeleev import *",
+            "assert element('Fe').symbol == 'Fe'",
+            "assert isotope('C', 14).mass_number == 14",
+            "assert len(get_all_elements()) == 118",
+            "assert len(get_attribute_for_all_elements('symbol')) == 118",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+import pytest
+
+from mendeleev import element
+from mendeleev.ionization import (
+    electrophilicity_matrix,
+    hardness_matrix,
+    ionization_energy_matrix,
+    mulliken_matrix,
+    softness_matrix,
+)
+
+
+def assert_matches(value, expected):
+    if expected is None:
+        assert math.isnan(value)
+    else:
+        assert value == pytest.approx(expected)
+
+
+def test_ionization_energy_matrix():
+    matrix = ionization_energy_matrix()
+    assert matrix.shape == (118, 118)
+    assert not matrix.flags.writeable
+    assert matrix[0, 0] == pytest.approx(element("H").ionenergies[1])
+    assert math.isnan(matrix[0, 1])
+    assert np.count_nonzero(~np.isnan(matrix)) == 5847
+    assert ionization_energy_matrix() is matrix
+
+
+@pytest.mark.parametrize("symbol", ["H", "He", "C", "Fe", "Xe", "U", "Og"])
+@pytest.mark.parametrize("charge", [0, 1, 2, 5])
+def test_descriptors_match_element(symbol, charge):
+    e = element(symbol)
+    z = e.atomic_number - 1
+    assert_matches(hardness_matrix()[z, charge], e.hardness(charge))
+    assert_matches(softness_matrix()[z, charge], e.softness(charge))
+    assert_matches(mulliken_matrix()[z, charge], e.electronegativity_mulliken(charge))
+
+
+@pytest.mark.parametrize("symbol", ["H", "He", "C", "Fe", "Xe"])
+def test_electrophilicity_matches_element(symbol):
+    e = element(symbol)
+    assert_matches(
+        electrophilicity_matrix()[e.atomic_number - 1, 0], e.electrophilicity()
+    )
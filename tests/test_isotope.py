@@ -1,6 +1,6 @@
-from mendeleev import isotope
+from mendeleev import element, isotope
 from mendeleev.db import get_session
-from mendeleev.models import Isotope
+from mendeleev.models import Isotope, repr_collection
 
 
 def test_get_isotope():
@@ -13,6 +13,10 @@ def test_get_isotope():
     assert result.atomic_number == 1
     assert result.mass_number == 3
 
+    result = isotope("Carbon", 14)
+    assert result.atomic_number == 6
+    assert result.mass_number == 14
+
 
 def test_isotopes_half_life_units():
     reference_units = (
@@ -43,3 +47,12 @@ def test_isotopes_half_life_units():
     units = sess.query(Isotope.half_life_unit).distinct().all()
     units = [u[0] for u in units]
     assert set(units) == set(reference_units)
+
+
+def test_repr_collection():
+    isotopes = element("Sn").isotopes
+    text = repr_collection(isotopes, limit=2)
+    assert text.count("<Isotope(") == 2
+    assert text.endswith(f"... ({len(isotopes) - 2} more)]")
+    assert repr_collection(isotopes[:2]) == repr(list(isotopes[:2]))
+    assert repr_collection(iter([1, 2, 3]), limit=2) == "[1, 2, ... (1 more)]"
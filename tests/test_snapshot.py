@@ -0,0 +1,61 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from mendeleev import element
+from mendeleev.snapshot import ElementSnapshot, IsotopeSnapshot, all_elements
+
+
+def atomic_weight(snapshot):
+    return snapshot.atomic_weight
+
+
+def test_all_elements():
+    elements = all_elements()
+    assert len(elements) == 118
+    assert [e.atomic_number for e in elements] == list(range(1, 119))
+    assert all_elements() is elements
+
+
+def test_snapshot_matches_element():
+    fe = element("Fe")
+    snapshot = fe.snapshot()
+    assert isinstance(snapshot, ElementSnapshot)
+    assert snapshot.symbol == fe.symbol
+    assert snapshot.description == fe.description
+    assert snapshot.series == fe.series
+    assert snapshot.group.symbol == fe.group.symbol
+    assert snapshot.mass_number == fe.mass_number
+    assert snapshot.ionenergies == fe.ionenergies
+    assert snapshot.oxistates == tuple(fe.oxistates)
+    assert len(snapshot.isotopes) == len(fe.isotopes)
+    assert all(isinstance(i, IsotopeSnapshot) for i in snapshot.isotopes)
+    assert len(snapshot.scattering_factors) == len(fe.scattering_factors)
+    assert snapshot == all_elements()[25]
+
+
+def test_snapshot_is_immutable():
+    snapshot = all_elements()[0]
+    with pytest.raises(AttributeError):
+        snapshot.symbol = "X"
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1
+    with pytest.raises(TypeError):
+        snapshot.ionenergies[1] = 0.0
+    assert not hasattr(snapshot, "__dict__")
+
+
+def test_snapshot_pickle():
+    elements = all_elements()
+    restored = pickle.loads(pickle.dumps(elements))
+    assert restored == elements
+    assert {hash(e) for e in restored} == {hash(e) for e in elements}
+    assert restored[25].ionenergies[1] == elements[25].ionenergies[1]
+
+
+def test_snapshot_process_pool():
+    elements = all_elements()[:4]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        weights = list(executor.map(atomic_weight, elements))
+    assert weights == [e.atomic_weight for e in elements]